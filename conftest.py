@@ -0,0 +1,24 @@
+"""Shared pytest configuration."""
+
+import os
+import sys
+
+import pytest
+
+
+def pytest_configure(config: pytest.Config) -> None:
+    """Put tmp_path directories on tmpfs (/dev/shm) on Linux.
+
+    The tests create many tiny files and directories, which is memory-speed on
+    tmpfs. Skipped when --basetemp, PYTEST_DEBUG_TEMPROOT or TMPDIR already
+    chooses a location. pytest still numbers and prunes the directories under
+    the temp root, so concurrent runs don't clash.
+    """
+    if (
+        config.option.basetemp is None
+        and "PYTEST_DEBUG_TEMPROOT" not in os.environ
+        and "TMPDIR" not in os.environ
+        and sys.platform.startswith("linux")
+        and os.access("/dev/shm", os.W_OK)
+    ):
+        os.environ["PYTEST_DEBUG_TEMPROOT"] = "/dev/shm"
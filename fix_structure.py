@@ -7,31 +7,74 @@ insta360/ subfolder within date folders and outputs shell commands to move them.
 Non-Insta360 files are ignored.
 """
 
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-import re
+import os
+import shlex
+import sys
 
 import typer
 
-app = typer.Typer(help="Generate shell commands to fix Insta360 file organization structure.")
-
-# Date folder pattern: YYYY-MM-DD optionally followed by anything (space, hyphen, etc.)
-DATE_FOLDER_PATTERN = re.compile(r"^\d{4}-\d{2}-\d{2}([ -].*)?$")
+# File type checks are shared with video_organise; is_insta360_file is re-exported
+from video_organise import is_insta360_file, is_insta360_name  # noqa: F401
 
-# Insta360 file extensions
-INSTA360_EXTENSIONS = {".insv", ".insp", ".lrv"}
+app = typer.Typer(help="Generate shell commands to fix Insta360 file organization structure.")
 
-# Insta360 specific filenames
-INSTA360_FILENAMES = {"fileinfo_list.list"}
+# Maps every ASCII digit to "0", so a date prefix translates to "0000-00-00"
+_DIGIT_MASK = str.maketrans("123456789", "000000000")
 
 
-def is_insta360_file(file_path: Path) -> bool:
-    """Check if file is an Insta360 file based on extension or filename."""
-    return file_path.suffix.lower() in INSTA360_EXTENSIONS or file_path.name in INSTA360_FILENAMES
+def is_date_folder_name(name: str) -> bool:
+    """Check if a folder name is YYYY-MM-DD, optionally followed by a space or hyphen suffix."""
+    return (
+        name[:10].translate(_DIGIT_MASK) == "0000-00-00"
+        and (len(name) == 10 or name[10] in " -")
+    )
 
 
 def is_date_folder(folder: Path) -> bool:
     """Check if a folder name matches the date pattern."""
-    return bool(DATE_FOLDER_PATTERN.match(folder.name))
+    return is_date_folder_name(folder.name)
+
+
+def scan_date_folder(date_folder: Path | str) -> tuple[list[str], int]:
+    """Recursively find Insta360 files in a date folder that need moving.
+
+    Uses os.scandir and works on path strings throughout, so no Path objects
+    are built, and file/directory checks reuse the type cached from the
+    directory listing.
+    Symlinks are never followed or returned. Files directly inside the
+    insta360/ subfolder are already compliant, so they are only counted,
+    never stat'd or returned.
+
+    Returns a tuple of (files to move, number of compliant files).
+    """
+    root = os.fspath(date_folder)
+    files: list[str] = []
+    compliant_count = 0
+    # A manual scandir walk rather than os.fwalk: fwalk only yields names, so
+    # telling regular files from symlinks would cost an extra fstatat per file,
+    # plus an open and fstat per directory that scandir does not need.
+    # (directory, whether its files are already compliant)
+    stack = [(root, False)]
+    while stack:
+        dir_path, compliant = stack.pop()
+        try:
+            entries = os.scandir(dir_path)
+        except OSError:
+            # Unreadable directory (e.g. permissions): skip it, as rglob did
+            continue
+        with entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append((entry.path, dir_path == root and entry.name == "insta360"))
+                elif not is_insta360_name(entry.name):
+                    continue
+                elif compliant:
+                    compliant_count += 1
+                elif entry.is_file(follow_symlinks=False):
+                    files.append(entry.path)
+    return files, compliant_count
 
 
 def get_date_folder(file_path: Path, base_dir: Path) -> Path | None:
@@ -46,15 +89,13 @@ def get_date_folder(file_path: Path, base_dir: Path) -> Path | None:
     return None
 
 
-def is_compliant(file_path: Path, date_folder: Path) -> bool:
-    """Check if a file is in the correct location (insta360/ subfolder)."""
-    expected_parent = date_folder / "insta360"
-    return file_path.parent == expected_parent
+def is_compliant(file_path: Path | str, date_folder: Path | str) -> bool:
+    """Check if a file is in the correct location (insta360/ subfolder).
 
-
-def shell_quote(path: Path) -> str:
-    """Quote a path for shell usage."""
-    return f'"{path}"'
+    Both paths are expected to come from the same source directory, so plain
+    string comparison of the parent is enough.
+    """
+    return os.path.dirname(file_path) == os.path.join(date_folder, "insta360")
 
 
 @app.command()
@@ -68,6 +109,13 @@ def main(
         resolve_path=True,
         help="Source directory containing date folders to fix.",
     ),
+    jobs: int = typer.Option(
+        8,
+        "--jobs",
+        "-j",
+        min=1,
+        help="Number of date folders to scan in parallel.",
+    ),
 ) -> None:
     """Generate shell commands to fix non-compliant Insta360 file organization.
 
@@ -77,67 +125,80 @@ def main(
     Only Insta360 files (.insv, .insp, .lrv, fileinfo_list.list) are processed.
     All other files are ignored.
     """
-    # Check for non-compliant folders in root (folders that don't match date pattern)
-    non_compliant_folders = [
-        d for d in source_directory.iterdir()
-        if d.is_dir() and not is_date_folder(d)
-    ]
+    # Classify root folders in a single pass: date folders are scanned,
+    # anything else is non-compliant and only warned about
+    date_folders: list[str] = []
+    non_compliant_folders: list[str] = []
+    with os.scandir(source_directory) as entries:
+        for entry in entries:
+            if not entry.is_dir(follow_symlinks=False):
+                continue
+            if is_date_folder_name(entry.name):
+                date_folders.append(entry.path)
+            else:
+                non_compliant_folders.append(entry.name)
+
     if non_compliant_folders:
         typer.echo("# Warning: Non-compliant folders found in root:", err=True)
-        for folder in sorted(non_compliant_folders):
-            typer.echo(f"#   {folder.name}", err=True)
+        for name in sorted(non_compliant_folders):
+            typer.echo(f"#   {name}", err=True)
         typer.echo("", err=True)
 
-    # Find all Insta360 files in date folders
-    files = [f for f in source_directory.rglob("*") if f.is_file() and is_insta360_file(f)]
-
-    if not files:
-        typer.echo("# No Insta360 files found in source directory.", err=True)
-        raise typer.Exit()
-
-    # Track which directories need to be created
-    dirs_to_create: set[Path] = set()
-    moves: list[tuple[Path, Path]] = []
+    # Moves are kept as parallel lists of source and target path strings
+    move_sources: list[str] = []
+    move_targets: list[str] = []
+    compliant_total = 0
 
-    for file_path in files:
-        date_folder = get_date_folder(file_path, source_directory)
+    # Find all Insta360 files in date folders; files elsewhere are ignored.
+    # Date folders are independent subtrees, so they are scanned concurrently
+    # to overlap directory-listing latency (e.g. on network shares).
+    with ThreadPoolExecutor(max_workers=max(1, min(jobs, len(date_folders)))) as executor:
+        scans = list(executor.map(scan_date_folder, date_folders))
 
-        if date_folder is None:
-            # File is not in a date folder, skip
+    for date_folder, (files, compliant_count) in zip(date_folders, scans):
+        compliant_total += compliant_count
+        if not files:
             continue
 
-        if is_compliant(file_path, date_folder):
-            # File is already in the right place
-            continue
+        # Every file in this date folder moves into the same target directory
+        target_dir = os.path.join(date_folder, "insta360")
 
-        # File needs to be moved
-        target_dir = date_folder / "insta360"
-        target_path = target_dir / file_path.name
+        for file_path in files:
+            move_sources.append(file_path)
+            move_targets.append(os.path.join(target_dir, os.path.basename(file_path)))
 
-        dirs_to_create.add(target_dir)
-        moves.append((file_path, target_path))
-
-    if not moves:
-        typer.echo("# All Insta360 files are already compliant.", err=True)
+    if not move_sources:
+        if compliant_total:
+            typer.echo("# All Insta360 files are already compliant.", err=True)
+        else:
+            typer.echo("# No Insta360 files found in date folders.", err=True)
         raise typer.Exit()
 
-    # Output shell script header
-    typer.echo("#!/usr/bin/env bash")
-    typer.echo("set -x")
-    typer.echo("")
-
-    # Output mkdir commands
-    for dir_path in sorted(dirs_to_create):
-        typer.echo(f"mkdir -p {shell_quote(dir_path)}")
-
-    typer.echo("")
-
-    # Output mv commands
-    for src, dest in sorted(moves):
-        typer.echo(f"mv {shell_quote(src)} {shell_quote(dest)}")
-
-    typer.echo("")
-    typer.echo(f"# {len(moves)} files to move", err=True)
+    # Sorting by source groups each date folder's moves together, so the
+    # directories to create come out of one pass in sorted order
+    moves = sorted(zip(move_sources, move_targets))
+
+    # Build the whole shell script, then write it in one go. Commands are plain
+    # f-strings: CPython compiles them to a single BUILD_STRING, which is
+    # faster than calling a pre-bound "mv {} {}".format per line.
+    lines = ["#!/usr/bin/env bash", "set -x", ""]
+    last_dir = None
+    for _, dest in moves:
+        target_dir = os.path.dirname(dest)
+        if target_dir != last_dir:
+            lines.append(f"mkdir -p {shlex.quote(target_dir)}")
+            last_dir = target_dir
+    lines.append("")
+    lines.extend(f"mv {shlex.quote(src)} {shlex.quote(dest)}" for src, dest in moves)
+    lines.append("")
+    # Encoded with the filesystem encoding, so names that are not valid
+    # UTF-8 come out as their original bytes instead of failing to print
+    script = os.fsencode("\n".join(lines) + "\n")
+    sys.stdout.flush()
+    sys.stdout.buffer.write(script)
+    sys.stdout.buffer.flush()
+
+    typer.echo(f"# {len(move_sources)} files to move", err=True)
 
 
 if __name__ == "__main__":
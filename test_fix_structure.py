@@ -1,5 +1,7 @@
 """Tests for fix_structure.py"""
 
+import os
+import sys
 from pathlib import Path
 
 import pytest
@@ -11,6 +13,7 @@ from fix_structure import (
     is_date_folder,
     get_date_folder,
     is_compliant,
+    scan_date_folder,
 )
 
 runner = CliRunner()
@@ -48,6 +51,10 @@ class TestIsInsta360File:
     def test_other_list_file_is_not_insta360(self, tmp_path: Path) -> None:
         assert is_insta360_file(tmp_path / "other.list") is False
 
+    def test_extension_without_dot_is_not_insta360(self, tmp_path: Path) -> None:
+        assert is_insta360_file(tmp_path / "insv") is False
+        assert is_insta360_file(tmp_path / ".insv") is False
+
 
 class TestIsDateFolder:
     """Tests for is_date_folder function."""
@@ -76,6 +83,18 @@ class TestIsDateFolder:
         folder = tmp_path / "insta360"
         assert is_date_folder(folder) is False
 
+    def test_date_with_other_separator(self, tmp_path: Path) -> None:
+        folder = tmp_path / "2024-01-15_project"
+        assert is_date_folder(folder) is False
+
+    def test_malformed_date(self, tmp_path: Path) -> None:
+        assert is_date_folder(tmp_path / "2024-1-15") is False
+        assert is_date_folder(tmp_path / "2024_01_15") is False
+        assert is_date_folder(tmp_path / "20240115") is False
+        assert is_date_folder(tmp_path / "20x4-01-15") is False
+        assert is_date_folder(tmp_path / "2024-01-1") is False
+        assert is_date_folder(tmp_path / "0000-00-00") is True
+
 
 class TestGetDateFolder:
     """Tests for get_date_folder function."""
@@ -129,6 +148,104 @@ class TestIsCompliant:
 
         assert is_compliant(file_path, date_folder) is False
 
+    def test_accepts_string_paths(self, tmp_path: Path) -> None:
+        date_folder = str(tmp_path / "2024-01-15")
+
+        assert is_compliant(f"{date_folder}/insta360/video.insv", date_folder) is True
+        assert is_compliant(f"{date_folder}/video.insv", date_folder) is False
+
+
+class TestScanDateFolder:
+    """Tests for scan_date_folder function."""
+
+    def test_finds_nested_insta360_files(self, tmp_path: Path) -> None:
+        date_folder = tmp_path / "2024-01-15"
+        camera_folder = date_folder / "Camera01"
+        camera_folder.mkdir(parents=True)
+        (camera_folder / "video.insv").write_text("content")
+        (date_folder / "photo.INSP").write_text("content")
+
+        files, compliant_count = scan_date_folder(date_folder)
+
+        assert sorted(files) == [
+            str(date_folder / "Camera01" / "video.insv"),
+            str(date_folder / "photo.INSP"),
+        ]
+        assert compliant_count == 0
+
+    def test_ignores_non_insta360_files(self, tmp_path: Path) -> None:
+        (tmp_path / "video.mp4").write_text("content")
+        (tmp_path / "metadata.json").write_text("{}")
+
+        assert scan_date_folder(tmp_path) == ([], 0)
+
+    def test_matches_extensions_in_any_case(self, tmp_path: Path) -> None:
+        for name in ("a.insv", "b.INSV", "c.Insv", "d.lRv", "e.InSp"):
+            (tmp_path / name).write_text("content")
+
+        files, _ = scan_date_folder(tmp_path)
+
+        assert len(files) == 5
+
+    def test_counts_files_already_in_insta360_folder(self, tmp_path: Path) -> None:
+        insta360_folder = tmp_path / "insta360"
+        (insta360_folder / "nested").mkdir(parents=True)
+        (insta360_folder / "video.insv").write_text("content")
+        (insta360_folder / "preview.lrv").write_text("content")
+        (insta360_folder / "nested" / "photo.insp").write_text("content")
+
+        files, compliant_count = scan_date_folder(tmp_path)
+
+        assert files == [str(insta360_folder / "nested" / "photo.insp")]
+        assert compliant_count == 2
+
+    def test_does_not_follow_symlinks(self, tmp_path: Path) -> None:
+        elsewhere = tmp_path / "elsewhere"
+        elsewhere.mkdir()
+        (elsewhere / "video.insv").write_text("content")
+        date_folder = tmp_path / "2024-01-15"
+        date_folder.mkdir()
+        (date_folder / "linked-dir").symlink_to(elsewhere)
+        (date_folder / "linked.insv").symlink_to(elsewhere / "video.insv")
+
+        assert scan_date_folder(date_folder) == ([], 0)
+
+    def test_ignores_directories_with_insta360_names(self, tmp_path: Path) -> None:
+        (tmp_path / "folder.insv").mkdir()
+
+        assert scan_date_folder(tmp_path) == ([], 0)
+
+    def test_skips_unreadable_directories(self, tmp_path: Path) -> None:
+        (tmp_path / "video.insv").write_text("content")
+        locked = tmp_path / "locked"
+        locked.mkdir()
+        (locked / "hidden.insv").write_text("content")
+        locked.chmod(0o000)
+        try:
+            if os.access(locked, os.R_OK):
+                pytest.skip("permissions are not enforced for this user (e.g. root)")
+            files, _ = scan_date_folder(tmp_path)
+        finally:
+            locked.chmod(0o755)
+
+        assert files == [str(tmp_path / "video.insv")]
+
+    def test_skips_directories_that_fail_to_open(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        (tmp_path / "video.insv").write_text("content")
+        locked = tmp_path / "locked"
+        locked.mkdir()
+        (locked / "hidden.insv").write_text("content")
+        real_scandir = os.scandir
+
+        def denying_scandir(path):
+            if os.fspath(path) == str(locked):
+                raise PermissionError(13, "Permission denied", str(locked))
+            return real_scandir(path)
+
+        monkeypatch.setattr(os, "scandir", denying_scandir)
+
+        assert scan_date_folder(tmp_path) == ([str(tmp_path / "video.insv")], 0)
+
 
 class TestCLI:
     """Tests for CLI interface."""
@@ -259,6 +376,32 @@ class TestCLI:
         assert "random-folder" in result.output
         assert "Camera01" in result.output
 
+    def test_jobs_option_does_not_change_output(self, tmp_path: Path) -> None:
+        for name in ("2024-01-15", "2024-01-16", "2024-01-17 Trip"):
+            camera_folder = tmp_path / name / "Camera01"
+            camera_folder.mkdir(parents=True)
+            (camera_folder / "video.insv").write_text("content")
+
+        serial = runner.invoke(app, [str(tmp_path), "--jobs", "1"])
+        parallel = runner.invoke(app, [str(tmp_path), "--jobs", "4"])
+
+        assert serial.exit_code == 0
+        assert parallel.output == serial.output
+        assert "3 files to move" in serial.output
+
+    def test_symlinked_date_folder_not_scanned(self, tmp_path: Path) -> None:
+        real_folder = tmp_path / "archive" / "2024-01-15"
+        real_folder.mkdir(parents=True)
+        (real_folder / "video.insv").write_text("content")
+        root = tmp_path / "root"
+        root.mkdir()
+        (root / "2024-01-15").symlink_to(real_folder)
+
+        result = runner.invoke(app, [str(root)])
+
+        assert result.exit_code == 0
+        assert "No Insta360 files found" in result.output
+
     def test_date_folder_with_space_suffix(self, tmp_path: Path) -> None:
         """Test folder names like '2023-03-03 Moggs in the dark'."""
         date_folder = tmp_path / "2023-03-03 Moggs in the dark"
@@ -273,3 +416,40 @@ class TestCLI:
         assert "/insta360" in result.output
         assert "VID_20230303_193624_00_001.insv" in result.output
         assert "1 files to move" in result.output
+
+    def test_quotes_shell_special_characters(self, tmp_path: Path) -> None:
+        """Paths with quotes or $ must survive being run through bash."""
+        date_folder = tmp_path / "2024-01-15 \"Tom's\" $HOME"
+        date_folder.mkdir()
+        (date_folder / "video.insv").write_text("content")
+
+        result = runner.invoke(app, [str(tmp_path)])
+
+        assert result.exit_code == 0
+        assert f"mkdir -p '{tmp_path}/2024-01-15 \"Tom'\"'\"'s\" $HOME/insta360'" in result.output
+
+    def test_one_mkdir_per_date_folder(self, tmp_path: Path) -> None:
+        for name in ("2024-01-15", "2024-01-15 Trip", "2024-01-16"):
+            camera_folder = tmp_path / name / "Camera01"
+            camera_folder.mkdir(parents=True)
+            (camera_folder / "video.insv").write_text("content")
+            (tmp_path / name / "photo.insp").write_text("content")
+
+        result = runner.invoke(app, [str(tmp_path)])
+
+        mkdir_lines = [line for line in result.output.splitlines() if line.startswith("mkdir")]
+        assert mkdir_lines == sorted(mkdir_lines)
+        assert len(mkdir_lines) == 3
+        assert "6 files to move" in result.output
+
+    @pytest.mark.skipif(sys.platform != "linux", reason="needs a filesystem that allows non-UTF-8 names")
+    def test_non_utf8_filename_written_as_raw_bytes(self, tmp_path: Path) -> None:
+        date_folder = tmp_path / "2024-01-15"
+        date_folder.mkdir()
+        raw_name = b"VID_\xff.insv"
+        (date_folder / os.fsdecode(raw_name)).write_text("content")
+
+        result = runner.invoke(app, [str(tmp_path)])
+
+        assert result.exit_code == 0
+        assert b"/insta360/" + raw_name in result.stdout_bytes
@@ -1,48 +1,164 @@
 """Tests for video_organise.py"""
 
+import errno
+import os
+import re
+import shutil
+import threading
+import time
+from collections import Counter
+from collections.abc import Mapping
 from datetime import date
 from pathlib import Path
 
 import pytest
+import typer
 from typer.testing import CliRunner
 
-from video_organise import app, get_file_date, get_date_from_filename, should_copy, format_size, is_insta360_file, is_in_excluded_folder, find_date_folder
+import video_organise
+from video_organise import FILENAME_DATE_PATTERN, app, organise, get_file_date, get_date_from_filename, should_copy, format_size, is_insta360_file, is_in_excluded_folder, find_date_folder, scandir_walk, copy_file, list_names, move_file, files_match, Verify
 
 runner = CliRunner()
 
 
+@pytest.fixture(scope="session", autouse=True)
+def _warm_app() -> None:
+    """Invoke the CLI once per session (per xdist worker) before any test runs.
+
+    The first invocation pays for lazy imports and help rendering setup
+    (~70ms), which would otherwise be charged to whichever test runs first.
+    """
+    runner.invoke(app, ["--help"], catch_exceptions=False)
+
+
+# Date that files without a date in their name are given: test files are
+# stamped with TODAY_TIMESTAMP (local noon on TODAY), see _stamp
+TODAY = date(2024, 1, 15)
+TODAY_STR = "2024-01-15"
+TODAY_TIMESTAMP = time.mktime((2024, 1, 15, 12, 0, 0, 0, 0, -1))
+
+
+class _FrozenDate(date):
+    """date subclass whose today() always returns TODAY."""
+
+    @classmethod
+    def today(cls) -> date:
+        return TODAY
+
+
+@pytest.fixture(autouse=True)
+def _frozen_today(monkeypatch: pytest.MonkeyPatch) -> date:
+    """Freeze date.today() as video_organise sees it.
+
+    Only today() is frozen: date.fromtimestamp stays real, so the filesystem
+    fallback really derives dates from the files' timestamps.
+    """
+    monkeypatch.setattr(video_organise, "date", _FrozenDate)
+    return TODAY
+
+
+def _stamp(path: Path, timestamp: float = TODAY_TIMESTAMP) -> None:
+    """Set path's access and modification times, so its filesystem date is known.
+
+    On macOS this also moves the creation time (st_birthtime) back to it.
+    """
+    os.utime(path, (timestamp, timestamp))
+
+
+def run_organise(capsys: pytest.CaptureFixture[str], *args, **kwargs) -> tuple[int, str]:
+    """Call organise() directly, bypassing CLI parsing.
+
+    Returns the exit code and the combined stdout/stderr output.
+    """
+    try:
+        organise(*args, **kwargs)
+        exit_code = 0
+    except typer.Exit as e:
+        exit_code = e.exit_code
+    captured = capsys.readouterr()
+    return exit_code, captured.out + captured.err
+
+
+def expected_dest(dest_dir: Path, name: str, date_str: str = TODAY_STR) -> Path:
+    """Where organise() puts a file: {dest}/{YYYY-MM-DD}/insta360/{name}."""
+    return dest_dir / date_str / "insta360" / name
+
+
+def _make_tree(root: Path, files: Mapping[str, bytes]) -> None:
+    """Create files (and their parent directories) under root from {relative path: content}."""
+    paths = {root / rel: content for rel, content in files.items()}
+    # Create each distinct parent once rather than once per file
+    for parent in dict.fromkeys(p.parent for p in paths):
+        os.makedirs(parent, exist_ok=True)
+    for p, content in paths.items():
+        p.write_bytes(content)
+        _stamp(p)
+
+
+@pytest.fixture(scope="session")
+def prebuilt_src(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """A source tree shared by tests that only read from it.
+
+    Contains video.insv at the root and Camera01/video2.insv. Tests using it
+    must not move or modify these files; use linked_src for that.
+    """
+    root = tmp_path_factory.mktemp("src_shared")
+    _make_tree(root, {"video.insv": b"video content", "Camera01/video2.insv": b"c2"})
+    return root
+
+
+@pytest.fixture
+def stat_calls(monkeypatch: pytest.MonkeyPatch) -> Counter[str]:
+    """Count os.stat calls per path for the duration of a test.
+
+    Results are not cached: a cache would hide stat results going stale
+    once files are copied.
+    """
+    calls: Counter[str] = Counter()
+    real_stat = os.stat
+
+    def counting_stat(path, *args, **kwargs):
+        calls[os.fspath(path)] += 1
+        return real_stat(path, *args, **kwargs)
+
+    monkeypatch.setattr(os, "stat", counting_stat)
+    return calls
+
+
+@pytest.fixture
+def linked_src(tmp_path: Path, prebuilt_src: Path) -> Path:
+    """A per-test copy of prebuilt_src made of hard links, for tests that move files.
+
+    Moving or deleting a link leaves the shared tree intact.
+    """
+    src_dir = tmp_path / "src"
+    shutil.copytree(prebuilt_src, src_dir, copy_function=os.link)
+    return src_dir
+
+
 class TestGetDateFromFilename:
     """Tests for get_date_from_filename function."""
 
-    def test_vid_filename(self, tmp_path: Path) -> None:
-        """Should extract date from VID_ prefixed filename."""
-        test_file = tmp_path / "VID_20241011_185020_00_003.insv"
-        result = get_date_from_filename(test_file)
-        assert result == date(2024, 10, 11)
-
-    def test_lrv_filename(self, tmp_path: Path) -> None:
-        """Should extract date from LRV_ prefixed filename."""
-        test_file = tmp_path / "LRV_20240926_150746_01_003.lrv"
-        result = get_date_from_filename(test_file)
-        assert result == date(2024, 9, 26)
-
-    def test_img_filename(self, tmp_path: Path) -> None:
-        """Should extract date from IMG_ prefixed filename."""
-        test_file = tmp_path / "IMG_20240915_133402_00_027.insp"
-        result = get_date_from_filename(test_file)
-        assert result == date(2024, 9, 15)
-
-    def test_no_date_in_filename(self, tmp_path: Path) -> None:
-        """Should return None for files without date pattern."""
-        test_file = tmp_path / "random_file.insv"
-        result = get_date_from_filename(test_file)
-        assert result is None
-
-    def test_fileinfo_list(self, tmp_path: Path) -> None:
-        """Should return None for fileinfo_list.list."""
-        test_file = tmp_path / "fileinfo_list.list"
-        result = get_date_from_filename(test_file)
-        assert result is None
+    @pytest.mark.parametrize(
+        "filename, expected",
+        [
+            ("VID_20241011_185020_00_003.insv", date(2024, 10, 11)),
+            ("LRV_20240926_150746_01_003.lrv", date(2024, 9, 26)),
+            ("IMG_20240915_133402_00_027.insp", date(2024, 9, 15)),
+            ("random_file.insv", None),
+            ("fileinfo_list.list", None),
+        ],
+        ids=["vid", "lrv", "img", "no-date", "fileinfo-list"],
+    )
+    def test_get_date_from_filename(self, filename: str, expected: date | None) -> None:
+        """Should extract the date from VID_/LRV_/IMG_ prefixes, else None."""
+        assert get_date_from_filename(Path(filename)) == expected
+
+    def test_pattern_is_precompiled_and_anchored(self) -> None:
+        """The filename pattern is compiled once at import and only matches prefixes."""
+        assert isinstance(FILENAME_DATE_PATTERN, re.Pattern)
+        assert FILENAME_DATE_PATTERN.pattern.startswith("^")
+        assert get_date_from_filename(Path("copy_VID_20241011_185020_00_003.insv")) is None
 
 
 class TestGetFileDate:
@@ -51,20 +167,42 @@ class TestGetFileDate:
     def test_returns_date_object(self, tmp_path: Path) -> None:
         """Should return a date object."""
         test_file = tmp_path / "test.insv"
-        test_file.write_text("content")
+        test_file.touch()
 
         result = get_file_date(test_file)
 
         assert isinstance(result, date)
 
     def test_returns_filesystem_date_for_generic_filename(self, tmp_path: Path) -> None:
-        """Should return today's date for file without date in filename."""
+        """Should return the filesystem date for file without date in filename."""
         test_file = tmp_path / "test.insv"
-        test_file.write_text("content")
+        test_file.touch()
+        _stamp(test_file)
+
+        result = get_file_date(test_file)
+
+        assert result == TODAY
+
+    def test_derives_date_from_file_timestamp(self, tmp_path: Path) -> None:
+        """Should date a file without a date in its name by its timestamp, not the clock."""
+        test_file = tmp_path / "test.insv"
+        test_file.touch()
+        _stamp(test_file, time.mktime((2023, 6, 1, 12, 0, 0, 0, 0, -1)))
 
         result = get_file_date(test_file)
 
-        assert result == date.today()
+        assert result == date(2023, 6, 1)
+
+    def test_uses_given_stat_without_statting(self, tmp_path: Path) -> None:
+        """Should use an already-fetched stat result instead of statting the path again."""
+        stamped = tmp_path / "stamped.insv"
+        stamped.touch()
+        _stamp(stamped, time.mktime((2023, 6, 1, 12, 0, 0, 0, 0, -1)))
+        stat = stamped.stat()
+        # The path doesn't exist, so any stat of it would raise
+        result = get_file_date(tmp_path / "missing.insv", stat)
+
+        assert result == date(2023, 6, 1)
 
     def test_prefers_filename_date_over_filesystem(self, tmp_path: Path) -> None:
         """Should use date from filename even if filesystem date differs."""
@@ -77,198 +215,441 @@ class TestGetFileDate:
         assert result == date(2023, 5, 5)
 
 
+@pytest.fixture(scope="session")
+def size_files(tmp_path_factory: pytest.TempPathFactory) -> dict[str, Path]:
+    """Read-only files of known sizes shared by the should_copy tests.
+
+    "medium" and "medium_copy" are distinct files with the same size;
+    "missing" is never created.
+    """
+    root = tmp_path_factory.mktemp("sizes")
+    files = {name: root / name for name in ("small", "medium", "medium_copy", "large", "missing")}
+    # should_copy only compares st_size, so size the files without writing data
+    for name, size in (("small", 5), ("medium", 7), ("medium_copy", 7), ("large", 19)):
+        files[name].touch()
+        os.truncate(files[name], size)
+    return files
+
+
 class TestShouldCopy:
     """Tests for should_copy function."""
 
-    def test_returns_true_when_dest_not_exists(self, tmp_path: Path) -> None:
+    def test_returns_true_when_dest_not_exists(self, size_files: dict[str, Path]) -> None:
         """Should return True when destination doesn't exist."""
-        src = tmp_path / "src.insv"
-        src.write_text("content")
-        dest = tmp_path / "dest.insv"
-
-        assert should_copy(src, dest) is True
+        assert should_copy(size_files["medium"], size_files["missing"]) is True
 
-    def test_returns_false_when_same_size(self, tmp_path: Path) -> None:
+    def test_returns_false_when_same_size(self, size_files: dict[str, Path]) -> None:
         """Should return False when destination exists with same size."""
-        src = tmp_path / "src.insv"
-        src.write_text("content")
-        dest = tmp_path / "dest.insv"
-        dest.write_text("content")
-
-        assert should_copy(src, dest) is False
+        assert should_copy(size_files["medium"], size_files["medium_copy"]) is False
 
-    def test_returns_true_when_different_size(self, tmp_path: Path) -> None:
+    def test_returns_true_when_different_size(self, size_files: dict[str, Path]) -> None:
         """Should return True when destination exists with different size."""
-        src = tmp_path / "src.insv"
-        src.write_text("longer content here")
-        dest = tmp_path / "dest.insv"
-        dest.write_text("short")
+        assert should_copy(size_files["large"], size_files["small"]) is True
 
-        assert should_copy(src, dest) is True
-
-    def test_returns_false_when_same_file(self, tmp_path: Path) -> None:
+    def test_returns_false_when_same_file(self, size_files: dict[str, Path]) -> None:
         """Should return False when source and destination are the same file."""
-        src = tmp_path / "video.insv"
-        src.write_text("content")
-
         # Same path should not be copied
-        assert should_copy(src, src) is False
+        assert should_copy(size_files["medium"], size_files["medium"]) is False
 
-    def test_returns_false_when_same_file_via_symlink(self, tmp_path: Path) -> None:
+    def test_returns_false_when_same_file_via_symlink(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
         """Should return False when paths resolve to the same file."""
         src = tmp_path / "video.insv"
-        src.write_text("content")
+        src.touch()
         link = tmp_path / "link.insv"
         link.symlink_to(src)
 
+        # Identity comes from st_dev/st_ino, not from resolving both paths
+        def fail_realpath(*args, **kwargs):
+            raise AssertionError("should_copy must not call realpath")
+
+        monkeypatch.setattr(os.path, "realpath", fail_realpath)
+
         # Link resolves to same file, should not be copied
         assert should_copy(src, link) is False
 
+    def test_returns_false_when_same_file_via_hardlink(self, tmp_path: Path) -> None:
+        """Should return False for two hard links to one inode, which path resolution can't detect."""
+        src = tmp_path / "video.insv"
+        src.touch()
+        link = tmp_path / "hardlink.insv"
+        os.link(src, link)
 
+        assert should_copy(src, link) is False
 
-class TestFormatSize:
-    """Tests for format_size function."""
 
-    def test_bytes(self) -> None:
-        assert format_size(500) == "500.0 B"
+class TestCopyFile:
+    """Tests for copy_file function."""
 
-    def test_kilobytes(self) -> None:
-        assert format_size(1024) == "1.0 KB"
+    @pytest.mark.skipif(not hasattr(os, "copy_file_range"), reason="needs os.copy_file_range")
+    def test_uses_copy_file_range(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Should copy through os.copy_file_range where the platform has it."""
+        src = tmp_path / "src.insv"
+        src.write_bytes(b"video content")
+        dest = tmp_path / "dest.insv"
+        calls = []
+        real_copy_file_range = os.copy_file_range
 
-    def test_megabytes(self) -> None:
-        assert format_size(1024 * 1024) == "1.0 MB"
+        def recording_copy_file_range(*args, **kwargs):
+            calls.append(args)
+            return real_copy_file_range(*args, **kwargs)
 
-    def test_gigabytes(self) -> None:
-        assert format_size(1024 * 1024 * 1024) == "1.0 GB"
+        monkeypatch.setattr(os, "copy_file_range", recording_copy_file_range)
 
+        copy_file(src, dest)
 
-class TestIsInsta360File:
-    """Tests for is_insta360_file function."""
+        assert calls
+        assert dest.read_bytes() == b"video content"
+
+    @pytest.mark.skipif(not hasattr(os, "copy_file_range"), reason="needs os.copy_file_range")
+    def test_advises_sequential_read_then_drops_source_pages(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Should hint sequential access on the source and release its cache afterwards."""
+        src = tmp_path / "src.insv"
+        src.write_bytes(b"video content")
+        dest = tmp_path / "dest.insv"
+        advice = []
+
+        def recording_fadvise(fd: int, offset: int, length: int, hint: int) -> None:
+            advice.append(hint)
+
+        monkeypatch.setattr(os, "posix_fadvise", recording_fadvise)
+
+        copy_file(src, dest)
+
+        assert advice == [os.POSIX_FADV_SEQUENTIAL, os.POSIX_FADV_DONTNEED]
+        assert dest.read_bytes() == b"video content"
 
-    def test_insv_is_insta360(self, tmp_path: Path) -> None:
-        assert is_insta360_file(tmp_path / "video.insv") is True
+    def test_falls_back_to_copyfile(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Should fall back to shutil.copyfile when copy_file_range is unsupported."""
+        src = tmp_path / "src.insv"
+        src.write_bytes(b"video content")
+        dest = tmp_path / "dest.insv"
+        calls = []
+        real_copyfile = shutil.copyfile
+
+        def unsupported(*args, **kwargs):
+            raise OSError(errno.EXDEV, "Invalid cross-device link")
+
+        def recording_copyfile(src, dst, *args, **kwargs):
+            calls.append(Path(src).name)
+            return real_copyfile(src, dst, *args, **kwargs)
+
+        monkeypatch.setattr(os, "copy_file_range", unsupported, raising=False)
+        monkeypatch.setattr(shutil, "copyfile", recording_copyfile)
 
-    def test_insp_is_insta360(self, tmp_path: Path) -> None:
-        assert is_insta360_file(tmp_path / "photo.insp") is True
+        copy_file(src, dest)
 
-    def test_lrv_is_insta360(self, tmp_path: Path) -> None:
-        assert is_insta360_file(tmp_path / "preview.lrv") is True
+        assert calls == ["src.insv"]
+        assert dest.read_bytes() == b"video content"
 
-    def test_uppercase_extensions(self, tmp_path: Path) -> None:
-        assert is_insta360_file(tmp_path / "video.INSV") is True
-        assert is_insta360_file(tmp_path / "photo.INSP") is True
-        assert is_insta360_file(tmp_path / "preview.LRV") is True
+    @pytest.mark.skipif(not hasattr(os, "copy_file_range"), reason="needs os.copy_file_range")
+    @pytest.mark.parametrize("stop_after", [0, 5], ids=["immediate-eof", "short-copy"])
+    def test_falls_back_when_copy_file_range_stops_short(
+        self, stop_after: int, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """A copy_file_range that reports EOF before the source size must not leave a truncated file."""
+        src = tmp_path / "src.insv"
+        src.write_bytes(b"video content")
+        dest = tmp_path / "dest.insv"
+        real_copy_file_range = os.copy_file_range
+        remaining = [stop_after]
+
+        def stops_short(in_fd: int, out_fd: int, count: int, *args) -> int:
+            if not remaining[0]:
+                return 0
+            n = real_copy_file_range(in_fd, out_fd, min(count, remaining[0]), *args)
+            remaining[0] -= n
+            return n
 
-    def test_mp4_is_not_insta360(self, tmp_path: Path) -> None:
-        assert is_insta360_file(tmp_path / "video.mp4") is False
+        monkeypatch.setattr(os, "copy_file_range", stops_short)
 
-    def test_json_is_not_insta360(self, tmp_path: Path) -> None:
-        assert is_insta360_file(tmp_path / "metadata.json") is False
+        copy_file(src, dest)
 
-    def test_mov_is_not_insta360(self, tmp_path: Path) -> None:
-        assert is_insta360_file(tmp_path / "video.mov") is False
+        assert dest.read_bytes() == b"video content"
 
-    def test_fileinfo_list_is_insta360(self, tmp_path: Path) -> None:
-        assert is_insta360_file(tmp_path / "fileinfo_list.list") is True
+    def test_interrupted_copy_leaves_nothing_under_the_real_name(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """A failure mid-copy should not leave a partial file that a re-run would skip."""
+        src = tmp_path / "src.insv"
+        src.write_bytes(b"video content")
+        dest = tmp_path / "dest.insv"
 
-    def test_other_list_file_is_not_insta360(self, tmp_path: Path) -> None:
-        assert is_insta360_file(tmp_path / "other.list") is False
+        def interrupted(*args, **kwargs):
+            raise KeyboardInterrupt
+
+        monkeypatch.setattr(shutil, "copystat", interrupted)
+
+        with pytest.raises(KeyboardInterrupt):
+            copy_file(src, dest)
+
+        assert sorted(p.name for p in tmp_path.iterdir()) == ["src.insv"]
+
+    def test_copies_mode_and_mtime(self, tmp_path: Path) -> None:
+        """Should carry over permission bits and modification time, like shutil.copy2."""
+        src = tmp_path / "src.insv"
+        src.write_bytes(b"video content")
+        src.chmod(0o640)
+        os.utime(src, ns=(1_700_000_000_000_000_000, 1_600_000_000_000_000_000))
+        dest = tmp_path / "dest.insv"
+
+        copy_file(src, dest)
+
+        assert dest.stat().st_mode & 0o777 == 0o640
+        assert dest.stat().st_mtime_ns == 1_600_000_000_000_000_000
+
+
+class TestFilesMatch:
+    """Tests for files_match function."""
+
+    @pytest.mark.parametrize(
+        "a, b, expected",
+        [
+            (b"video content", b"video content", True),
+            (b"video content", b"video c0ntent", False),
+            (b"", b"", True),
+            (b"x" * (1 << 20) + b"a", b"x" * (1 << 20) + b"b", False),
+        ],
+        ids=["identical", "differs", "empty", "differs-after-first-chunk"],
+    )
+    def test_files_match(self, a: bytes, b: bytes, expected: bool, tmp_path: Path) -> None:
+        (tmp_path / "a").write_bytes(a)
+        (tmp_path / "b").write_bytes(b)
+        assert files_match(tmp_path / "a", tmp_path / "b") is expected
+
+
+class TestMoveFile:
+    """Tests for move_file function."""
+
+    def test_renames_on_same_filesystem(self, tmp_path: Path) -> None:
+        src = tmp_path / "src.insv"
+        src.write_bytes(b"video content")
+        inode = src.stat().st_ino
+        dest = tmp_path / "dest.insv"
+
+        move_file(src, dest)
+
+        assert not src.exists()
+        assert dest.stat().st_ino == inode
+
+    def test_replaces_existing_destination(self, tmp_path: Path) -> None:
+        src = tmp_path / "src.insv"
+        src.write_bytes(b"new")
+        dest = tmp_path / "dest.insv"
+        dest.write_bytes(b"old content")
+
+        move_file(src, dest)
+
+        assert dest.read_bytes() == b"new"
+
+    def test_copies_then_removes_across_filesystems(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Should fall back to copy_file + unlink when rename crosses devices."""
+        src = tmp_path / "src.insv"
+        src.write_bytes(b"video content")
+        os.utime(src, ns=(1_700_000_000_000_000_000, 1_600_000_000_000_000_000))
+        dest = tmp_path / "dest.insv"
+        real_replace = os.replace
+
+        def cross_device(a, b):
+            # Only the move itself crosses devices, not copy_file's rename into place
+            if Path(a) == src:
+                raise OSError(errno.EXDEV, "Invalid cross-device link")
+            real_replace(a, b)
+
+        monkeypatch.setattr(os, "replace", cross_device)
+
+        move_file(src, dest)
+
+        assert not src.exists()
+        assert dest.read_bytes() == b"video content"
+        assert dest.stat().st_mtime_ns == 1_600_000_000_000_000_000
+
+    def test_keeps_source_when_copy_is_incomplete(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        """A cross-device copy that comes up short must not delete the source."""
+        src = tmp_path / "src.insv"
+        src.write_bytes(b"video content")
+        dest = tmp_path / "dest.insv"
+
+        def cross_device(*args, **kwargs):
+            raise OSError(errno.EXDEV, "Invalid cross-device link")
+
+        def truncating_copy(src: Path, dest: Path) -> None:
+            Path(dest).write_bytes(b"")
+
+        monkeypatch.setattr(os, "replace", cross_device)
+        monkeypatch.setattr(video_organise, "copy_file", truncating_copy)
+
+        with pytest.raises(OSError, match="Incomplete copy"):
+            move_file(src, dest)
+
+        assert src.read_bytes() == b"video content"
+
+    def test_other_errors_propagate(self, tmp_path: Path) -> None:
+        with pytest.raises(FileNotFoundError):
+            move_file(tmp_path / "missing.insv", tmp_path / "dest.insv")
+
+
+class TestFormatSize:
+    """Tests for format_size function."""
+
+    @pytest.mark.parametrize(
+        "size_bytes, expected",
+        [
+            (0, "0.0 B"),
+            (500, "500.0 B"),
+            (1023, "1023.0 B"),
+            (1024, "1.0 KB"),
+            (1536, "1.5 KB"),
+            (1024 * 1024, "1.0 MB"),
+            (1024 * 1024 * 1024, "1.0 GB"),
+            (1024**4, "1.0 TB"),
+            (1024**5, "1.0 PB"),
+            (1024**2 - 1, "1024.0 KB"),
+            (2048 * 1024**5, "2048.0 PB"),
+        ],
+        ids=[
+            "zero", "bytes", "just-under-kilobyte", "kilobytes", "fractional", "megabytes", "gigabytes", "terabytes",
+            "petabytes", "rounds-within-unit", "beyond-petabytes",
+        ],
+    )
+    def test_format_size(self, size_bytes: int, expected: str) -> None:
+        assert format_size(size_bytes) == expected
+
+
+class TestIsInsta360File:
+    """Tests for is_insta360_file function."""
+
+    @pytest.mark.parametrize(
+        "filename, expected",
+        [
+            ("video.insv", True),
+            ("photo.insp", True),
+            ("preview.lrv", True),
+            ("video.INSV", True),
+            ("photo.INSP", True),
+            ("preview.LRV", True),
+            ("fileinfo_list.list", True),
+            ("video.mp4", False),
+            ("metadata.json", False),
+            ("video.mov", False),
+            ("other.list", False),
+            ("insv", False),
+            (".insv", False),
+        ],
+    )
+    def test_is_insta360_file(self, filename: str, expected: bool) -> None:
+        assert is_insta360_file(Path(filename)) is expected
 
 
 class TestCLI:
     """Tests for CLI interface."""
 
-    def test_dry_run_default(self, tmp_path: Path) -> None:
+    pytestmark = pytest.mark.slow
+
+    def test_dry_run_default(self, tmp_path: Path, prebuilt_src: Path) -> None:
         """Default mode should be dry-run (no files copied)."""
-        src_dir = tmp_path / "src"
-        src_dir.mkdir()
         dest_dir = tmp_path / "dest"
         dest_dir.mkdir()
 
-        test_file = src_dir / "video.insv"
-        test_file.write_text("video content")
-
-        result = runner.invoke(app, [str(src_dir), str(dest_dir)])
+        result = runner.invoke(app, [str(prebuilt_src), str(dest_dir)])
 
         assert result.exit_code == 0
         assert "[DRY RUN]" in result.output
         assert "Would copy" in result.output
         # File should NOT be copied
-        assert not (dest_dir / date.today().strftime("%Y-%m-%d") / "insta360" / "video.insv").exists()
+        assert not expected_dest(dest_dir, "video.insv").exists()
 
-    def test_approve_copies_files(self, tmp_path: Path) -> None:
+    def test_approve_copies_files(
+        self, tmp_path: Path, prebuilt_src: Path, capsys: pytest.CaptureFixture[str]
+    ) -> None:
         """With --approve, files should be copied."""
-        src_dir = tmp_path / "src"
-        src_dir.mkdir()
         dest_dir = tmp_path / "dest"
         dest_dir.mkdir()
 
-        test_file = src_dir / "video.insv"
-        test_file.write_text("video content")
+        test_file = prebuilt_src / "video.insv"
 
-        result = runner.invoke(app, [str(src_dir), str(dest_dir), "--approve"])
+        exit_code, output = run_organise(capsys, prebuilt_src, dest_dir, approve=True)
 
-        assert result.exit_code == 0
-        assert "Copied:" in result.output
+        assert exit_code == 0
+        assert "Copied:" in output
 
         # File should be copied (source still exists)
-        expected_dest = dest_dir / date.today().strftime("%Y-%m-%d") / "insta360" / "video.insv"
-        assert expected_dest.exists()
-        assert expected_dest.read_text() == "video content"
+        dest_file = expected_dest(dest_dir, "video.insv")
+        assert dest_file.read_bytes() == b"video content"
         assert test_file.exists()  # Source file still exists after copy
 
-    def test_move_flag_moves_files(self, tmp_path: Path) -> None:
-        """With --approve --move, files should be moved."""
+    @pytest.mark.parametrize("size", [1 << 20, 4 << 20], ids=["1MiB", "4MiB"])
+    def test_approve_copies_large_files(self, tmp_path: Path, size: int, capsys: pytest.CaptureFixture[str]) -> None:
+        """Multi-megabyte files should be copied intact."""
+        data = os.urandom(size)
         src_dir = tmp_path / "src"
-        src_dir.mkdir()
         dest_dir = tmp_path / "dest"
         dest_dir.mkdir()
+        _make_tree(src_dir, {"video.insv": data})
 
-        test_file = src_dir / "video.insv"
-        test_file.write_text("video content")
+        exit_code, output = run_organise(capsys, src_dir, dest_dir, approve=True)
 
-        result = runner.invoke(app, [str(src_dir), str(dest_dir), "--approve", "--move"])
+        assert exit_code == 0
+        assert expected_dest(dest_dir, "video.insv").read_bytes() == data
 
-        assert result.exit_code == 0
-        assert "Moved:" in result.output
+    def test_approve_preserves_timestamps(self, tmp_path: Path, capsys: pytest.CaptureFixture[str]) -> None:
+        """Copies should keep the source modification time, like shutil.copy2."""
+        src_dir = tmp_path / "src"
+        dest_dir = tmp_path / "dest"
+        dest_dir.mkdir()
+        _make_tree(src_dir, {"video.insv": b"video content"})
+        os.utime(src_dir / "video.insv", ns=(1_700_000_000_000_000_000, 1_600_000_000_123_456_789))
+
+        exit_code, output = run_organise(capsys, src_dir, dest_dir, approve=True)
+
+        assert exit_code == 0
+        date_str = date.fromtimestamp(1_600_000_000).isoformat()
+        assert expected_dest(dest_dir, "video.insv", date_str).stat().st_mtime_ns == 1_600_000_000_123_456_789
+
+    def test_move_flag_moves_files(
+        self, tmp_path: Path, linked_src: Path, capsys: pytest.CaptureFixture[str]
+    ) -> None:
+        """With --approve --move, files should be moved."""
+        dest_dir = tmp_path / "dest"
+        dest_dir.mkdir()
+
+        test_file = linked_src / "video.insv"
+
+        exit_code, output = run_organise(capsys, linked_src, dest_dir, approve=True, move=True)
+
+        assert exit_code == 0
+        assert "Moved:" in output
 
         # File should be moved (source no longer exists)
-        expected_dest = dest_dir / date.today().strftime("%Y-%m-%d") / "insta360" / "video.insv"
-        assert expected_dest.exists()
-        assert expected_dest.read_text() == "video content"
+        dest_file = expected_dest(dest_dir, "video.insv")
+        assert dest_file.read_bytes() == b"video content"
         assert not test_file.exists()  # Source file removed after move
 
-    def test_move_dry_run(self, tmp_path: Path) -> None:
+    def test_move_dry_run(self, tmp_path: Path, prebuilt_src: Path, capsys: pytest.CaptureFixture[str]) -> None:
         """Dry run with --move should show 'Would move'."""
-        src_dir = tmp_path / "src"
-        src_dir.mkdir()
         dest_dir = tmp_path / "dest"
         dest_dir.mkdir()
 
-        test_file = src_dir / "video.insv"
-        test_file.write_text("video content")
+        test_file = prebuilt_src / "video.insv"
 
-        result = runner.invoke(app, [str(src_dir), str(dest_dir), "--move"])
+        exit_code, output = run_organise(capsys, prebuilt_src, dest_dir, move=True)
 
-        assert result.exit_code == 0
-        assert "[DRY RUN]" in result.output
-        assert "Would move" in result.output
-        assert "Run with --approve to move files" in result.output
+        assert exit_code == 0
+        assert "[DRY RUN]" in output
+        assert "Would move" in output
+        assert "Run with --approve to move files" in output
         # File should NOT be moved in dry run
         assert test_file.exists()
 
-    def test_dry_run_shows_full_paths(self, tmp_path: Path) -> None:
+    def test_dry_run_shows_full_paths(self, tmp_path: Path, prebuilt_src: Path) -> None:
         """Dry run should show full source and destination paths."""
-        src_dir = tmp_path / "src"
-        nested = src_dir / "Camera01"
-        nested.mkdir(parents=True)
         dest_dir = tmp_path / "dest"
         dest_dir.mkdir()
 
-        test_file = nested / "video.insv"
-        test_file.write_text("video content")
+        test_file = prebuilt_src / "Camera01" / "video2.insv"
 
-        result = runner.invoke(app, [str(src_dir), str(dest_dir)])
+        result = runner.invoke(app, [str(prebuilt_src), str(dest_dir)])
 
         assert result.exit_code == 0
         # Should show full source path
@@ -276,50 +657,169 @@ class TestCLI:
         # Should show full destination path
         assert str(dest_dir) in result.output
 
-    def test_skips_existing_same_size(self, tmp_path: Path) -> None:
-        """Should skip files that already exist with same size."""
-        src_dir = tmp_path / "src"
-        src_dir.mkdir()
+    def test_dry_run_output_order(self, tmp_path: Path, prebuilt_src: Path) -> None:
+        """Per-file lines should land between the summary and the --approve hint."""
         dest_dir = tmp_path / "dest"
         dest_dir.mkdir()
 
-        test_file = src_dir / "video.insv"
-        test_file.write_text("video content")
+        result = runner.invoke(app, [str(prebuilt_src), str(dest_dir)])
 
+        assert result.exit_code == 0
+        lines = result.output.splitlines()
+        assert lines[0].startswith("[DRY RUN] Would copy 2 files")
+        assert lines[1] == ""
+        assert all(line.startswith("Would copy: ") for line in lines[2:4])
+        assert lines[4:] == ["", "Run with --approve to copy files."]
+
+    def test_skips_existing_same_size(self, tmp_path: Path, capsys: pytest.CaptureFixture[str]) -> None:
+        """Should skip files that already exist with same size."""
+        src_dir = tmp_path / "src"
+        dest_dir = tmp_path / "dest"
+
+        _make_tree(src_dir, {"video.insv": b"video content"})
         # Pre-create destination file with same content
-        date_folder = dest_dir / date.today().strftime("%Y-%m-%d") / "insta360"
-        date_folder.mkdir(parents=True)
-        existing = date_folder / "video.insv"
-        existing.write_text("video content")
+        _make_tree(dest_dir, {f"{TODAY_STR}/insta360/video.insv": b"video content"})
 
-        result = runner.invoke(app, [str(src_dir), str(dest_dir)])
+        exit_code, output = run_organise(capsys, src_dir, dest_dir)
 
-        assert result.exit_code == 0
-        assert "Skipping 1 files" in result.output
+        assert exit_code == 0
+        assert "Skipping 1 files" in output
 
-    def test_copies_when_different_size(self, tmp_path: Path) -> None:
-        """Should copy files that exist but have different size."""
+    def test_skips_existing_in_unlistable_folder(
+        self, tmp_path: Path, capsys: pytest.CaptureFixture[str], monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """If the insta360 folder can't be listed, existing files should still be found by stat."""
         src_dir = tmp_path / "src"
-        src_dir.mkdir()
         dest_dir = tmp_path / "dest"
-        dest_dir.mkdir()
+        _make_tree(src_dir, {"video.insv": b"video content"})
+        _make_tree(dest_dir, {f"{TODAY_STR}/insta360/video.insv": b"video content"})
 
-        test_file = src_dir / "video.insv"
-        test_file.write_text("new longer video content")
+        insta360_dir = dest_dir / TODAY_STR / "insta360"
+        real_listdir = os.listdir
+
+        def listdir(path):
+            if Path(path) == insta360_dir:
+                raise PermissionError(errno.EACCES, "Permission denied", path)
+            return real_listdir(path)
+
+        monkeypatch.setattr(video_organise.os, "listdir", listdir)
 
+        exit_code, output = run_organise(capsys, src_dir, dest_dir)
+
+        assert exit_code == 0
+        assert "Skipping 1 files" in output
+
+    def test_copies_when_different_size(self, tmp_path: Path, capsys: pytest.CaptureFixture[str]) -> None:
+        """Should copy files that exist but have different size."""
+        src_dir = tmp_path / "src"
+        dest_dir = tmp_path / "dest"
+
+        _make_tree(src_dir, {"video.insv": b"new longer video content"})
         # Pre-create destination file with different content
-        date_folder = dest_dir / date.today().strftime("%Y-%m-%d") / "insta360"
-        date_folder.mkdir(parents=True)
-        existing = date_folder / "video.insv"
-        existing.write_text("old")
+        _make_tree(dest_dir, {f"{TODAY_STR}/insta360/video.insv": b"old"})
+        existing = expected_dest(dest_dir, "video.insv")
+
+        exit_code, output = run_organise(capsys, src_dir, dest_dir, approve=True)
+
+        assert exit_code == 0
+        assert "Copied:" in output
+        assert existing.read_bytes() == b"new longer video content"
+
+    @pytest.mark.parametrize(
+        "verify, expected",
+        [
+            (Verify.NONE, "Skipping 2 files (already exist, not verified)"),
+            (Verify.SIZE, "Would copy: "),
+            (Verify.CONTENT, "Would copy: "),
+        ],
+        ids=["none", "size", "content"],
+    )
+    def test_verify_modes_on_changed_file(
+        self, verify: Verify, expected: str, tmp_path: Path, capsys: pytest.CaptureFixture[str]
+    ) -> None:
+        """--verify decides how much evidence an existing destination needs."""
+        src_dir = tmp_path / "src"
+        dest_dir = tmp_path / "dest"
+        _make_tree(src_dir, {"video.insv": b"same", "photo.insp": b"new content"})
+        _make_tree(dest_dir, {f"{TODAY_STR}/insta360/video.insv": b"same", f"{TODAY_STR}/insta360/photo.insp": b"old"})
 
-        result = runner.invoke(app, [str(src_dir), str(dest_dir), "--approve"])
+        exit_code, output = run_organise(capsys, src_dir, dest_dir, verify=verify)
 
-        assert result.exit_code == 0
-        assert "Copied:" in result.output
-        assert existing.read_text() == "new longer video content"
+        assert exit_code == 0
+        assert expected in output
+
+    def test_verify_content_catches_same_size_change(self, tmp_path: Path, capsys: pytest.CaptureFixture[str]) -> None:
+        """Same size but different bytes is only caught by --verify content."""
+        src_dir = tmp_path / "src"
+        dest_dir = tmp_path / "dest"
+        _make_tree(src_dir, {"video.insv": b"new!"})
+        _make_tree(dest_dir, {f"{TODAY_STR}/insta360/video.insv": b"old!"})
+        existing = expected_dest(dest_dir, "video.insv")
+
+        _, output = run_organise(capsys, src_dir, dest_dir)
+        assert "Skipping 1 files (already exist with same size)" in output
+
+        _, output = run_organise(capsys, src_dir, dest_dir, verify=Verify.CONTENT)
+        assert f"Would copy: {src_dir / 'video.insv'} -> {existing} (content differs)" in output
+
+        exit_code, _ = run_organise(capsys, src_dir, dest_dir, approve=True, verify=Verify.CONTENT)
+        assert exit_code == 0
+        assert existing.read_bytes() == b"new!"
+
+    def test_verify_none_copies_case_only_match(self, tmp_path: Path, capsys: pytest.CaptureFixture[str]) -> None:
+        """With --verify none, a destination name differing only in case is not the same file."""
+        src_dir = tmp_path / "src"
+        dest_dir = tmp_path / "dest"
+        _make_tree(src_dir, {"VIDEO.INSV": b"video content"})
+        _make_tree(dest_dir, {f"{TODAY_STR}/insta360/video.insv": b"video content"})
+        case_sensitive = not expected_dest(dest_dir, "VIDEO.INSV").exists()
+
+        exit_code, output = run_organise(capsys, src_dir, dest_dir, approve=True, verify=Verify.NONE)
+
+        assert exit_code == 0
+        if case_sensitive:
+            assert "Copying 1 files" in output
+            assert expected_dest(dest_dir, "VIDEO.INSV").read_bytes() == b"video content"
+        else:
+            assert "Skipping 1 files (already exist, not verified)" in output
+
+    def test_dry_run_with_insta360_file_instead_of_folder(
+        self, tmp_path: Path, capsys: pytest.CaptureFixture[str]
+    ) -> None:
+        """A regular file named insta360 in the date folder should not crash a dry run."""
+        src_dir = tmp_path / "src"
+        dest_dir = tmp_path / "dest"
+        _make_tree(src_dir, {"video.insv": b"video content"})
+        _make_tree(dest_dir, {f"{TODAY_STR}/insta360": b"not a folder"})
+
+        exit_code, output = run_organise(capsys, src_dir, dest_dir)
+
+        assert exit_code == 0
+        assert "Would copy 1 files" in output
+
+    def test_verify_none_skips_destination_stat(
+        self, tmp_path: Path, stat_calls: Counter[str], capsys: pytest.CaptureFixture[str]
+    ) -> None:
+        """With --verify none, the exact name is lstat'ed but never size-checked with stat."""
+        src_dir = tmp_path / "src"
+        dest_dir = tmp_path / "dest"
+        _make_tree(src_dir, {"video.insv": b"video content"})
+        _make_tree(dest_dir, {f"{TODAY_STR}/insta360/video.insv": b"video content"})
 
-    def test_creates_date_folders(self, tmp_path: Path) -> None:
+        exit_code, _ = run_organise(capsys, src_dir, dest_dir, verify=Verify.NONE)
+
+        assert exit_code == 0
+        assert stat_calls[str(expected_dest(dest_dir, "video.insv"))] == 0
+
+    def test_verify_option(self, tmp_path: Path, prebuilt_src: Path) -> None:
+        """--verify should be accepted on the command line and reject unknown modes."""
+        dest_dir = tmp_path / "dest"
+        dest_dir.mkdir()
+
+        assert runner.invoke(app, [str(prebuilt_src), str(dest_dir), "--verify", "content"]).exit_code == 0
+        assert runner.invoke(app, [str(prebuilt_src), str(dest_dir), "--verify", "xxh3"]).exit_code == 2
+
+    def test_creates_date_folders(self, tmp_path: Path, capsys: pytest.CaptureFixture[str]) -> None:
         """Should create date-based folder structure."""
         src_dir = tmp_path / "src"
         src_dir.mkdir()
@@ -327,18 +827,19 @@ class TestCLI:
         dest_dir.mkdir()
 
         test_file = src_dir / "video.insv"
-        test_file.write_text("content")
+        test_file.write_bytes(b"content")
+        _stamp(test_file)
 
-        result = runner.invoke(app, [str(src_dir), str(dest_dir), "--approve"])
+        exit_code, output = run_organise(capsys, src_dir, dest_dir, approve=True)
 
-        assert result.exit_code == 0
+        assert exit_code == 0
 
         # Check folder structure
-        date_folder = dest_dir / date.today().strftime("%Y-%m-%d")
-        assert date_folder.exists()
-        assert (date_folder / "insta360").exists()
+        date_folder = dest_dir / TODAY_STR
+        # is_dir() on the leaf also implies the date folder exists
+        assert (date_folder / "insta360").is_dir()
 
-    def test_preserves_filename(self, tmp_path: Path) -> None:
+    def test_preserves_filename(self, tmp_path: Path, capsys: pytest.CaptureFixture[str]) -> None:
         """Should preserve original filename and use date from filename."""
         src_dir = tmp_path / "src"
         src_dir.mkdir()
@@ -346,103 +847,288 @@ class TestCLI:
         dest_dir.mkdir()
 
         test_file = src_dir / "VID_20230303_193624_00_001.insv"
-        test_file.write_text("content")
+        test_file.write_bytes(b"content")
 
-        result = runner.invoke(app, [str(src_dir), str(dest_dir), "--approve"])
+        exit_code, output = run_organise(capsys, src_dir, dest_dir, approve=True)
 
-        assert result.exit_code == 0
+        assert exit_code == 0
         # Date extracted from filename (2023-03-03), not filesystem
-        expected_dest = dest_dir / "2023-03-03" / "insta360" / "VID_20230303_193624_00_001.insv"
-        assert expected_dest.exists()
+        dest_file = expected_dest(dest_dir, "VID_20230303_193624_00_001.insv", "2023-03-03")
+        assert dest_file.read_bytes() == b"content"
 
-    def test_handles_multiple_insta360_files(self, tmp_path: Path) -> None:
+    def test_skips_files_already_in_place(self, tmp_path: Path, capsys: pytest.CaptureFixture[str]) -> None:
+        """Should skip files whose destination is the source file itself."""
+        _make_tree(tmp_path, {f"{TODAY_STR}/insta360/video.insv": b"video content"})
+
+        exit_code, output = run_organise(capsys, tmp_path, tmp_path, approve=True)
+
+        assert exit_code == 0
+        assert "Copying 0 files" in output
+        assert "Skipping 1 files (already in correct location)" in output
+
+    def test_nothing_to_copy_stops_after_summary(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch, capsys: pytest.CaptureFixture[str]
+    ) -> None:
+        """A re-run with everything imported should print only the summary."""
+        src_dir = tmp_path / "src"
+        dest_dir = tmp_path / "dest"
+        _make_tree(src_dir, {"video.insv": b"video content"})
+        _make_tree(dest_dir, {f"{TODAY_STR}/insta360/video.insv": b"video content"})
+        monkeypatch.setattr(video_organise, "ThreadPoolExecutor", None)
+
+        exit_code, output = run_organise(capsys, src_dir, dest_dir, approve=True)
+
+        assert exit_code == 0
+        assert output.splitlines() == ["Copying 0 files (0.0 B)", "Skipping 1 files (already exist with same size)"]
+
+        _, output = run_organise(capsys, src_dir, dest_dir)
+        assert "Run with --approve" not in output
+
+    def test_handles_multiple_insta360_files(self, tmp_path: Path, capsys: pytest.CaptureFixture[str]) -> None:
         """Should handle multiple Insta360 files."""
         src_dir = tmp_path / "src"
-        src_dir.mkdir()
         dest_dir = tmp_path / "dest"
         dest_dir.mkdir()
 
-        (src_dir / "video.insv").write_text("content1")
-        (src_dir / "photo.insp").write_text("content2")
-        (src_dir / "preview.lrv").write_text("content3")
+        _make_tree(src_dir, {"video.insv": b"content1", "photo.insp": b"content2", "preview.lrv": b"content3"})
 
-        result = runner.invoke(app, [str(src_dir), str(dest_dir), "--approve"])
+        exit_code, output = run_organise(capsys, src_dir, dest_dir, approve=True)
 
-        assert result.exit_code == 0
-        assert "Copying 3 files" in result.output
+        assert exit_code == 0
+        assert "Copying 3 files" in output
 
-    def test_handles_nested_directories(self, tmp_path: Path) -> None:
-        """Should handle nested source directories."""
+    @pytest.mark.parametrize("jobs", [1, 2, 8])
+    def test_jobs_copies_all_files_in_order(
+        self, jobs: int, tmp_path: Path, capsys: pytest.CaptureFixture[str]
+    ) -> None:
+        """Any --jobs value copies every file and logs them in planning order."""
+        src_dir = tmp_path / "src"
+        dest_dir = tmp_path / "dest"
+        dest_dir.mkdir()
+        files = {f"VID_2024011{i}_000000_00_00{i}.insv": bytes([i]) * (i + 1) for i in range(5)}
+        _make_tree(src_dir, files)
+
+        _, preview = run_organise(capsys, src_dir, dest_dir)
+        exit_code, output = run_organise(capsys, src_dir, dest_dir, approve=True, jobs=jobs)
+
+        assert exit_code == 0
+        planned = [
+            line.split(": ", 1)[1].rsplit(" (", 1)[0] for line in preview.splitlines() if line.startswith("Would copy: ")
+        ]
+        copied = [line.split(": ", 1)[1] for line in output.splitlines() if line.startswith("Copied: ")]
+        assert len(copied) == len(files)
+        assert copied == planned
+        for i, name in enumerate(sorted(files)):
+            assert expected_dest(dest_dir, name, f"2024-01-1{i}").read_bytes() == files[name]
+
+    def test_creates_each_date_folder_once(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch, capsys: pytest.CaptureFixture[str]
+    ) -> None:
+        """Files sharing a date folder should not each re-create it."""
+        src_dir = tmp_path / "src"
+        dest_dir = tmp_path / "dest"
+        # Existing date folders, so mkdir(parents=True) doesn't recurse
+        (dest_dir / "2024-01-15").mkdir(parents=True)
+        (dest_dir / "2024-01-16").mkdir()
+        _make_tree(src_dir, {f"VID_20240115_00000{i}_00_001.insv": b"x" for i in range(5)})
+        _make_tree(src_dir, {"VID_20240116_000000_00_001.insv": b"y"})
+
+        mkdirs: list[Path] = []
+        real_mkdir = Path.mkdir
+
+        def counting_mkdir(self: Path, *args, **kwargs) -> None:
+            mkdirs.append(self)
+            real_mkdir(self, *args, **kwargs)
+
+        monkeypatch.setattr(Path, "mkdir", counting_mkdir)
+
+        exit_code, _ = run_organise(capsys, src_dir, dest_dir, approve=True)
+
+        assert exit_code == 0
+        assert sorted(mkdirs) == [dest_dir / "2024-01-15" / "insta360", dest_dir / "2024-01-16" / "insta360"]
+
+    def test_copy_failure_propagates(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch, capsys: pytest.CaptureFixture[str]
+    ) -> None:
+        """An error in a worker thread should surface instead of being swallowed."""
+        src_dir = tmp_path / "src"
+        dest_dir = tmp_path / "dest"
+        dest_dir.mkdir()
+        _make_tree(src_dir, {"video.insv": b"a", "photo.insp": b"b"})
+
+        def fail(src: Path, dest: Path) -> None:
+            raise OSError(errno.ENOSPC, "No space left on device")
+
+        monkeypatch.setattr(video_organise, "copy_file", fail)
+
+        with pytest.raises(OSError, match="No space left"):
+            run_organise(capsys, src_dir, dest_dir, approve=True, jobs=2)
+
+    def test_copy_failure_does_not_wait_for_running_copies(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch, capsys: pytest.CaptureFixture[str]
+    ) -> None:
+        """The first failure should surface while other transfers are still in flight."""
+        src_dir = tmp_path / "src"
+        dest_dir = tmp_path / "dest"
+        dest_dir.mkdir()
+        _make_tree(src_dir, {"video.insv": b"a", "photo.insp": b"b"})
+        _, preview = run_organise(capsys, src_dir, dest_dir)
+        first = Path(next(line for line in preview.splitlines() if line.startswith("Would copy: ")).split(" ")[2])
+        started, release, finished = threading.Event(), threading.Event(), threading.Event()
+
+        def fail_first_block_rest(src: Path, dest: Path) -> None:
+            if src == first:
+                # Fail only once the other transfer is running
+                started.wait(timeout=10)
+                raise OSError(errno.ENOSPC, "No space left on device")
+            started.set()
+            release.wait(timeout=10)
+            finished.set()
+
+        monkeypatch.setattr(video_organise, "copy_file", fail_first_block_rest)
+
+        try:
+            with pytest.raises(OSError, match="No space left"):
+                run_organise(capsys, src_dir, dest_dir, approve=True, jobs=2)
+            # Raised while the other copy was still running
+            assert not finished.is_set()
+        finally:
+            release.set()
+
+    def test_dry_run_never_calls_os_stat_on_sources(
+        self, tmp_path: Path, stat_calls: Counter[str], capsys: pytest.CaptureFixture[str]
+    ) -> None:
+        """Planning should take each source's stat from its scandir DirEntry, never os.stat."""
         src_dir = tmp_path / "src"
         src_dir.mkdir()
-        nested = src_dir / "Camera01"
-        nested.mkdir()
         dest_dir = tmp_path / "dest"
         dest_dir.mkdir()
 
-        (src_dir / "video1.insv").write_text("content1")
-        (nested / "video2.insv").write_text("content2")
+        sources = [src_dir / "video.insv", src_dir / "photo.insp", src_dir / "preview.lrv"]
+        for f in sources:
+            f.write_bytes(b"content")
 
-        result = runner.invoke(app, [str(src_dir), str(dest_dir), "--approve"])
+        exit_code, output = run_organise(capsys, src_dir, dest_dir)
 
-        assert result.exit_code == 0
-        assert "Copying 2 files" in result.output
+        assert exit_code == 0
+        assert "Would copy 3 files" in output
+        assert all(stat_calls[str(f)] == 0 for f in sources)
 
-    def test_ignores_non_insta360_files(self, tmp_path: Path) -> None:
+    def test_new_files_skip_destination_stat(
+        self, tmp_path: Path, stat_calls: Counter[str], capsys: pytest.CaptureFixture[str]
+    ) -> None:
+        """Files not in the destination listing should not be statted there."""
+        src_dir = tmp_path / "src"
+        dest_dir = tmp_path / "dest"
+        _make_tree(src_dir, {"video.insv": b"new", "photo.insp": b"same"})
+        _make_tree(dest_dir, {f"{TODAY_STR}/insta360/photo.insp": b"same"})
+
+        exit_code, output = run_organise(capsys, src_dir, dest_dir)
+
+        assert exit_code == 0
+        assert "Would copy 1 files" in output
+        assert "Skipping 1 files (already exist with same size)" in output
+        assert stat_calls[str(expected_dest(dest_dir, "video.insv"))] == 0
+        assert stat_calls[str(expected_dest(dest_dir, "photo.insp"))] == 1
+
+    def test_case_only_name_match_is_statted(self, tmp_path: Path, capsys: pytest.CaptureFixture[str]) -> None:
+        """A listing match that differs only in case is confirmed with a stat."""
+        src_dir = tmp_path / "src"
+        dest_dir = tmp_path / "dest"
+        _make_tree(src_dir, {"video.insv": b"new"})
+        _make_tree(dest_dir, {f"{TODAY_STR}/insta360/VIDEO.INSV": b"other"})
+
+        exit_code, output = run_organise(capsys, src_dir, dest_dir)
+
+        assert exit_code == 0
+        if (dest_dir / TODAY_STR / "insta360" / "video.insv").exists():
+            # Case-insensitive filesystem: it's the same name
+            assert "size mismatch" in output
+        else:
+            assert "(dest missing)" in output
+
+    def test_handles_nested_directories(
+        self, tmp_path: Path, prebuilt_src: Path, capsys: pytest.CaptureFixture[str]
+    ) -> None:
+        """Should handle nested source directories."""
+        dest_dir = tmp_path / "dest"
+        dest_dir.mkdir()
+
+        exit_code, output = run_organise(capsys, prebuilt_src, dest_dir, approve=True)
+
+        assert exit_code == 0
+        assert "Copying 2 files" in output
+
+    def test_handles_deeply_nested_directories(self, tmp_path: Path, capsys: pytest.CaptureFixture[str]) -> None:
+        """Should find files at every level of a deep source tree."""
+        src_dir = tmp_path / "src"
+        dest_dir = tmp_path / "dest"
+        dest_dir.mkdir()
+        _make_tree(src_dir, {
+            "root.insv": b"0",
+            "a/one.insv": b"1",
+            "a/b/two.insp": b"2",
+            "a/b/c/three.lrv": b"3",
+            "a/b/c/d/four.insv": b"4",
+        })
+
+        exit_code, output = run_organise(capsys, src_dir, dest_dir, approve=True)
+
+        assert exit_code == 0
+        assert "Copying 5 files" in output
+        for name in ("root.insv", "one.insv", "two.insp", "three.lrv", "four.insv"):
+            assert expected_dest(dest_dir, name).is_file()
+
+    def test_ignores_non_insta360_files(self, tmp_path: Path, capsys: pytest.CaptureFixture[str]) -> None:
         """Should ignore non-Insta360 files."""
         src_dir = tmp_path / "src"
-        src_dir.mkdir()
         dest_dir = tmp_path / "dest"
         dest_dir.mkdir()
 
-        (src_dir / "video.insv").write_text("insta360 content")
-        (src_dir / "video.mp4").write_text("mp4 content")
-        (src_dir / "metadata.json").write_text("{}")
+        _make_tree(src_dir, {"video.insv": b"insta360 content", "video.mp4": b"mp4 content", "metadata.json": b"{}"})
 
-        result = runner.invoke(app, [str(src_dir), str(dest_dir), "--approve"])
+        exit_code, output = run_organise(capsys, src_dir, dest_dir, approve=True)
 
-        assert result.exit_code == 0
-        assert "Copying 1 files" in result.output
+        assert exit_code == 0
+        assert "Copying 1 files" in output
 
         # Only insv file should be copied
-        date_folder = dest_dir / date.today().strftime("%Y-%m-%d") / "insta360"
-        assert (date_folder / "video.insv").exists()
+        date_folder = dest_dir / TODAY_STR / "insta360"
+        assert (date_folder / "video.insv").read_bytes() == b"insta360 content"
         assert not (date_folder / "video.mp4").exists()
         assert not (date_folder / "metadata.json").exists()
 
-    def test_empty_source_directory(self, tmp_path: Path) -> None:
+    def test_empty_source_directory(self, tmp_path: Path, capsys: pytest.CaptureFixture[str]) -> None:
         """Should handle empty source directory."""
         src_dir = tmp_path / "src"
         src_dir.mkdir()
         dest_dir = tmp_path / "dest"
         dest_dir.mkdir()
 
-        result = runner.invoke(app, [str(src_dir), str(dest_dir)])
+        exit_code, output = run_organise(capsys, src_dir, dest_dir)
 
-        assert result.exit_code == 0
-        assert "No Insta360 files found" in result.output
+        assert exit_code == 0
+        assert "No Insta360 files found" in output
 
-    def test_no_insta360_files(self, tmp_path: Path) -> None:
+    def test_no_insta360_files(self, tmp_path: Path, capsys: pytest.CaptureFixture[str]) -> None:
         """Should report no files when only non-Insta360 files exist."""
         src_dir = tmp_path / "src"
-        src_dir.mkdir()
         dest_dir = tmp_path / "dest"
         dest_dir.mkdir()
 
-        (src_dir / "video.mp4").write_text("mp4 content")
-        (src_dir / "metadata.json").write_text("{}")
+        _make_tree(src_dir, {"video.mp4": b"mp4 content", "metadata.json": b"{}"})
 
-        result = runner.invoke(app, [str(src_dir), str(dest_dir)])
+        exit_code, output = run_organise(capsys, src_dir, dest_dir)
 
-        assert result.exit_code == 0
-        assert "No Insta360 files found" in result.output
+        assert exit_code == 0
+        assert "No Insta360 files found" in output
 
     def test_nonexistent_source(self, tmp_path: Path) -> None:
         """Should error on nonexistent source directory."""
         dest_dir = tmp_path / "dest"
         dest_dir.mkdir()
 
-        result = runner.invoke(app, ["/nonexistent/path", str(dest_dir)])
+        result = runner.invoke(app, ["/nonexistent/path", str(dest_dir)], catch_exceptions=False)
 
         assert result.exit_code != 0
 
@@ -451,168 +1137,227 @@ class TestCLI:
         src_dir = tmp_path / "src"
         src_dir.mkdir()
 
-        result = runner.invoke(app, [str(src_dir), "/nonexistent/path"])
+        result = runner.invoke(app, [str(src_dir), "/nonexistent/path"], catch_exceptions=False)
 
         assert result.exit_code != 0
 
-    def test_excludes_misc_folder(self, tmp_path: Path) -> None:
+    def test_excludes_misc_folder(self, tmp_path: Path, capsys: pytest.CaptureFixture[str]) -> None:
         """Should ignore files in MISC folder."""
         src_dir = tmp_path / "src"
-        src_dir.mkdir()
-        misc_dir = src_dir / "MISC"
-        misc_dir.mkdir()
         dest_dir = tmp_path / "dest"
         dest_dir.mkdir()
 
-        # Create file in MISC (should be ignored)
-        (misc_dir / "video.insv").write_text("misc data")
-        # Create file outside MISC (should be processed)
-        (src_dir / "real_video.insv").write_text("real video")
+        _make_tree(src_dir, {
+            # In MISC (should be ignored)
+            "MISC/video.insv": b"misc data",
+            # Outside MISC (should be processed)
+            "real_video.insv": b"real video",
+        })
 
-        result = runner.invoke(app, [str(src_dir), str(dest_dir)])
+        exit_code, output = run_organise(capsys, src_dir, dest_dir)
 
-        assert result.exit_code == 0
-        assert "Would copy 1 files" in result.output
-        assert "real_video.insv" in result.output
-        assert "MISC" not in result.output
+        assert exit_code == 0
+        assert "Would copy 1 files" in output
+        assert "real_video.insv" in output
+        assert "MISC" not in output
 
-    def test_excludes_nested_misc_folder(self, tmp_path: Path) -> None:
+    def test_excludes_nested_misc_folder(self, tmp_path: Path, capsys: pytest.CaptureFixture[str]) -> None:
         """Should ignore files in nested MISC folder."""
         src_dir = tmp_path / "src"
-        dcim = src_dir / "DCIM"
-        misc_dir = dcim / "MISC"
-        misc_dir.mkdir(parents=True)
-        camera_dir = dcim / "Camera01"
-        camera_dir.mkdir()
         dest_dir = tmp_path / "dest"
         dest_dir.mkdir()
 
-        # Create file in nested MISC (should be ignored)
-        (misc_dir / "VID_20241226_160400_00_029.insv").write_text("misc data")
-        # Create file in Camera01 (should be processed)
-        (camera_dir / "VID_20241226_160400_00_029.insv").write_text("real video")
+        _make_tree(src_dir, {
+            # In nested MISC (should be ignored)
+            "DCIM/MISC/VID_20241226_160400_00_029.insv": b"misc data",
+            # In Camera01 (should be processed)
+            "DCIM/Camera01/VID_20241226_160400_00_029.insv": b"real video",
+        })
 
-        result = runner.invoke(app, [str(src_dir), str(dest_dir)])
+        exit_code, output = run_organise(capsys, src_dir, dest_dir)
 
-        assert result.exit_code == 0
-        assert "Would copy 1 files" in result.output
-        assert "Camera01" in result.output
+        assert exit_code == 0
+        assert "Would copy 1 files" in output
+        assert "Camera01" in output
 
-    def test_duplicate_filenames_error(self, tmp_path: Path) -> None:
+    def test_duplicate_filenames_error(self, tmp_path: Path, capsys: pytest.CaptureFixture[str]) -> None:
         """Should error when same filename exists in different folders."""
         src_dir = tmp_path / "src"
-        folder1 = src_dir / "Camera01"
-        folder2 = src_dir / "Camera02"
-        folder1.mkdir(parents=True)
-        folder2.mkdir()
         dest_dir = tmp_path / "dest"
         dest_dir.mkdir()
 
-        # Create same filename in different folders
-        (folder1 / "video.insv").write_text("content1")
-        (folder2 / "video.insv").write_text("content2")
+        # Same filename in different folders
+        _make_tree(src_dir, {"Camera01/video.insv": b"content1", "Camera02/video.insv": b"content2"})
 
-        result = runner.invoke(app, [str(src_dir), str(dest_dir)])
+        exit_code, output = run_organise(capsys, src_dir, dest_dir)
 
-        assert result.exit_code == 1
-        assert "Duplicate filenames found" in result.output
-        assert "video.insv" in result.output
+        assert exit_code == 1
+        assert "Duplicate filenames found" in output
+        assert "video.insv" in output
 
-    def test_same_filename_different_extensions_ok(self, tmp_path: Path) -> None:
+    def test_duplicate_filenames_copy_nothing(self, tmp_path: Path, capsys: pytest.CaptureFixture[str]) -> None:
+        """A duplicate found late in the scan should still stop the run before any copy."""
+        src_dir = tmp_path / "src"
+        dest_dir = tmp_path / "dest"
+        dest_dir.mkdir()
+
+        _make_tree(
+            src_dir, {"Camera01/video.insv": b"content1", "Camera01/photo.insp": b"p", "Camera02/video.insv": b"content2"}
+        )
+
+        exit_code, _ = run_organise(capsys, src_dir, dest_dir, approve=True)
+
+        assert exit_code == 1
+        assert list(dest_dir.iterdir()) == []
+
+    def test_same_filename_different_extensions_ok(self, tmp_path: Path, capsys: pytest.CaptureFixture[str]) -> None:
         """Should allow same base name with different extensions."""
         src_dir = tmp_path / "src"
-        src_dir.mkdir()
         dest_dir = tmp_path / "dest"
         dest_dir.mkdir()
 
         # Same base name, different extensions - should be fine
-        (src_dir / "video.insv").write_text("video")
-        (src_dir / "video.lrv").write_text("low-res")
+        _make_tree(src_dir, {"video.insv": b"video", "video.lrv": b"low-res"})
 
-        result = runner.invoke(app, [str(src_dir), str(dest_dir)])
+        exit_code, output = run_organise(capsys, src_dir, dest_dir)
 
-        assert result.exit_code == 0
-        assert "Would copy 2 files" in result.output
+        assert exit_code == 0
+        assert "Would copy 2 files" in output
 
 
 class TestIsInExcludedFolder:
     """Tests for is_in_excluded_folder function."""
 
-    def test_misc_folder(self, tmp_path: Path) -> None:
+    def test_misc_folder(self) -> None:
         """Should return True for files in MISC folder."""
-        file_path = tmp_path / "MISC" / "video.insv"
+        file_path = Path("/media/card/MISC/video.insv")
         assert is_in_excluded_folder(file_path) is True
 
-    def test_nested_misc_folder(self, tmp_path: Path) -> None:
+    def test_nested_misc_folder(self) -> None:
         """Should return True for files in nested MISC folder."""
-        file_path = tmp_path / "DCIM" / "MISC" / "video.insv"
+        file_path = Path("/media/card/DCIM/MISC/video.insv")
         assert is_in_excluded_folder(file_path) is True
 
-    def test_camera_folder(self, tmp_path: Path) -> None:
+    def test_camera_folder(self) -> None:
         """Should return False for files in Camera folder."""
-        file_path = tmp_path / "DCIM" / "Camera01" / "video.insv"
+        file_path = Path("/media/card/DCIM/Camera01/video.insv")
         assert is_in_excluded_folder(file_path) is False
 
-    def test_root_folder(self, tmp_path: Path) -> None:
+    def test_root_folder(self) -> None:
         """Should return False for files in root."""
-        file_path = tmp_path / "video.insv"
+        file_path = Path("/media/card/video.insv")
         assert is_in_excluded_folder(file_path) is False
 
 
-class TestFindDateFolder:
-    """Tests for find_date_folder function."""
+class TestScandirWalk:
+    """Tests for scandir_walk function."""
 
-    def test_returns_existing_folder_with_suffix(self, tmp_path: Path) -> None:
-        """Should find existing folder with project name suffix."""
-        existing = tmp_path / "2024-01-15 Project Name"
-        existing.mkdir()
+    def test_matches_rglob(self, tmp_path: Path) -> None:
+        """Should yield the same files as rglob("*") filtered by is_file()."""
+        _make_tree(tmp_path, {
+            "video.insv": b"a",
+            "notes.txt": b"b",
+            "DCIM/Camera01/VID_20241011_185020_00_003.insv": b"c",
+            "DCIM/MISC/fileinfo_list.list": b"d",
+            "other/photo.insp": b"e",
+        })
+        (tmp_path / "empty").mkdir()
+        (tmp_path / "DCIM" / "linked_dir").symlink_to(tmp_path / "other")
+        (tmp_path / "linked_file.insv").symlink_to(tmp_path / "video.insv")
 
-        result = find_date_folder(tmp_path, "2024-01-15")
-        assert result == existing
+        expected = sorted(str(p) for p in tmp_path.rglob("*") if p.is_file())
+        assert sorted(entry.path for entry in scandir_walk(tmp_path)) == expected
+        # Directory symlinks are not descended into; file symlinks are included
+        assert str(tmp_path / "DCIM" / "linked_dir" / "photo.insp") not in expected
+        assert str(tmp_path / "linked_file.insv") in expected
 
-    def test_returns_existing_folder_exact_match(self, tmp_path: Path) -> None:
-        """Should find existing folder with exact date match."""
-        existing = tmp_path / "2024-01-15"
-        existing.mkdir()
+    def test_empty_directory(self, tmp_path: Path) -> None:
+        assert list(scandir_walk(tmp_path)) == []
 
-        result = find_date_folder(tmp_path, "2024-01-15")
-        assert result == existing
+    def test_skips_symlink_loop(self, tmp_path: Path) -> None:
+        """A self-referencing symlink should be skipped, not abort the walk."""
+        (tmp_path / "video.insv").write_bytes(b"a")
+        (tmp_path / "loop.insv").symlink_to("loop.insv")
 
-    def test_returns_default_when_no_match(self, tmp_path: Path) -> None:
-        """Should return default path when no matching folder exists."""
-        result = find_date_folder(tmp_path, "2024-01-15")
-        assert result == tmp_path / "2024-01-15"
+        assert [entry.name for entry in scandir_walk(tmp_path)] == ["video.insv"]
+
+    def test_skips_dangling_symlink(self, tmp_path: Path) -> None:
+        (tmp_path / "video.insv").write_bytes(b"a")
+        (tmp_path / "dangling.insv").symlink_to(tmp_path / "missing.insv")
+
+        assert [entry.name for entry in scandir_walk(tmp_path)] == ["video.insv"]
+
+
+class TestListNames:
+    """Tests for list_names function."""
+
+    def test_lists_normalised_names(self, tmp_path: Path) -> None:
+        _make_tree(tmp_path, {"VID_20240115_000000_00_001.insv": b"a", "sub/x.insp": b"b"})
+        assert list_names(tmp_path) == {"vid_20240115_000000_00_001.insv", "sub"}
+
+    def test_missing_directory(self, tmp_path: Path) -> None:
+        assert list_names(tmp_path / "missing") == frozenset()
+
+    def test_regular_file(self, tmp_path: Path) -> None:
+        (tmp_path / "insta360").write_bytes(b"")
+        assert list_names(tmp_path / "insta360") == frozenset()
+
+    def test_unlistable_directory(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        """A directory that exists but can't be listed has unknown contents, not none."""
+        def denied(path):
+            raise PermissionError(errno.EACCES, "Permission denied", path)
+
+        monkeypatch.setattr(video_organise.os, "listdir", denied)
+        assert list_names(tmp_path) is None
+
+
+@pytest.fixture(scope="module")
+def dest_tree(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """A read-only destination tree shared by the find_date_folder tests."""
+    root = tmp_path_factory.mktemp("dest")
+    (root / "2024-01-15").mkdir()
+    (root / "2024-01-16 Project Name").mkdir()
+    (root / "2024-02-01 Project A").mkdir()
+    (root / "2024-02-01 Project B").mkdir()
+    (root / "2024-03-01-file.txt").write_bytes(b"not a folder")
+    return root
 
-    def test_returns_default_when_dest_empty(self, tmp_path: Path) -> None:
-        """Should return default path when destination is empty."""
-        result = find_date_folder(tmp_path, "2024-01-15")
-        assert result == tmp_path / "2024-01-15"
 
-    def test_ignores_files_with_date_prefix(self, tmp_path: Path) -> None:
-        """Should ignore files, only match directories."""
-        (tmp_path / "2024-01-15-file.txt").write_text("not a folder")
+class TestFindDateFolder:
+    """Tests for find_date_folder function."""
+
+    @pytest.mark.parametrize(
+        "date_str, expected_name",
+        [
+            ("2024-01-15", "2024-01-15"),
+            ("2024-01-16", "2024-01-16 Project Name"),
+            ("2024-04-01", "2024-04-01"),
+            ("2024-03-01", "2024-03-01"),
+        ],
+        ids=["exact-match", "existing-with-suffix", "default-when-no-match", "ignores-files-with-date-prefix"],
+    )
+    def test_returns_single_folder(self, dest_tree: Path, date_str: str, expected_name: str) -> None:
+        """Should return the one matching folder, or the default YYYY-MM-DD path if none match."""
+        assert find_date_folder(dest_tree, date_str) == dest_tree / expected_name
 
+    def test_returns_default_when_dest_empty(self, tmp_path: Path) -> None:
+        """Should return default path when destination is empty."""
         result = find_date_folder(tmp_path, "2024-01-15")
         assert result == tmp_path / "2024-01-15"
 
-    def test_returns_list_when_multiple_matches(self, tmp_path: Path) -> None:
+    def test_returns_list_when_multiple_matches(self, dest_tree: Path) -> None:
         """Should return list when multiple folders match same date."""
-        folder1 = tmp_path / "2024-01-15 Project A"
-        folder2 = tmp_path / "2024-01-15 Project B"
-        folder1.mkdir()
-        folder2.mkdir()
-
-        result = find_date_folder(tmp_path, "2024-01-15")
+        result = find_date_folder(dest_tree, "2024-02-01")
         assert isinstance(result, list)
-        assert len(result) == 2
-        assert folder1 in result
-        assert folder2 in result
+        assert sorted(result) == [dest_tree / "2024-02-01 Project A", dest_tree / "2024-02-01 Project B"]
 
 
 class TestCLIDateFolderMatching:
     """Tests for CLI date folder matching behavior."""
 
-    def test_uses_existing_folder_with_suffix(self, tmp_path: Path) -> None:
+    pytestmark = pytest.mark.slow
+
+    def test_uses_existing_folder_with_suffix(self, tmp_path: Path, capsys: pytest.CaptureFixture[str]) -> None:
         """Should use existing date folder with suffix instead of creating new one."""
         src_dir = tmp_path / "src"
         src_dir.mkdir()
@@ -626,38 +1371,31 @@ class TestCLIDateFolderMatching:
 
         # Create source file with date in filename
         test_file = src_dir / "VID_20230303_193624_00_001.insv"
-        test_file.write_text("video content")
+        test_file.write_bytes(b"video content")
 
-        result = runner.invoke(app, [str(src_dir), str(dest_dir)])
+        exit_code, output = run_organise(capsys, src_dir, dest_dir)
 
-        assert result.exit_code == 0
+        assert exit_code == 0
         # Should target the existing folder with suffix
-        assert "2023-03-03 Moggs Sting" in result.output
-        assert "2023-03-03/insta360" not in result.output
+        assert "2023-03-03 Moggs Sting" in output
+        assert "2023-03-03/insta360" not in output
 
-    def test_skips_existing_file_in_renamed_folder(self, tmp_path: Path) -> None:
+    def test_skips_existing_file_in_renamed_folder(self, tmp_path: Path, capsys: pytest.CaptureFixture[str]) -> None:
         """Should recognize file exists in renamed folder."""
         src_dir = tmp_path / "src"
-        src_dir.mkdir()
         dest_dir = tmp_path / "dest"
-        dest_dir.mkdir()
-
-        # Create existing folder with suffix and file
-        existing_folder = dest_dir / "2023-03-03 Moggs Sting"
-        insta360_folder = existing_folder / "insta360"
-        insta360_folder.mkdir(parents=True)
-        (insta360_folder / "VID_20230303_193624_00_001.insv").write_text("video content")
 
-        # Create source file with same content
-        test_file = src_dir / "VID_20230303_193624_00_001.insv"
-        test_file.write_text("video content")
+        # Existing folder with suffix and file
+        _make_tree(dest_dir, {"2023-03-03 Moggs Sting/insta360/VID_20230303_193624_00_001.insv": b"video content"})
+        # Source file with same content
+        _make_tree(src_dir, {"VID_20230303_193624_00_001.insv": b"video content"})
 
-        result = runner.invoke(app, [str(src_dir), str(dest_dir)])
+        exit_code, output = run_organise(capsys, src_dir, dest_dir)
 
-        assert result.exit_code == 0
-        assert "Skipping 1 files (already exist with same size)" in result.output
+        assert exit_code == 0
+        assert "Skipping 1 files (already exist with same size)" in output
 
-    def test_errors_on_multiple_date_folders(self, tmp_path: Path) -> None:
+    def test_errors_on_multiple_date_folders(self, tmp_path: Path, capsys: pytest.CaptureFixture[str]) -> None:
         """Should error when multiple folders match same date prefix."""
         src_dir = tmp_path / "src"
         src_dir.mkdir()
@@ -670,12 +1408,44 @@ class TestCLIDateFolderMatching:
 
         # Create source file with that date
         test_file = src_dir / "VID_20230303_193624_00_001.insv"
-        test_file.write_text("video content")
+        test_file.write_bytes(b"video content")
+
+        exit_code, output = run_organise(capsys, src_dir, dest_dir)
 
-        result = runner.invoke(app, [str(src_dir), str(dest_dir)])
+        assert exit_code == 1
+        assert "Multiple destination folders found for same date" in output
+        assert "2023-03-03" in output
+        assert "Project A" in output
+        assert "Project B" in output
 
-        assert result.exit_code == 1
-        assert "Multiple destination folders found for same date" in result.output
-        assert "2023-03-03" in result.output
-        assert "Project A" in result.output
-        assert "Project B" in result.output
+    def test_looks_up_each_date_folder_once(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch, capsys: pytest.CaptureFixture[str]
+    ) -> None:
+        """Files sharing a date should reuse one destination lookup."""
+        src_dir = tmp_path / "src"
+        dest_dir = tmp_path / "dest"
+        (dest_dir / "2023-03-03 Moggs Sting").mkdir(parents=True)
+        _make_tree(
+            src_dir,
+            {
+                "VID_20230303_193624_00_001.insv": b"a",
+                "LRV_20230303_193624_01_001.lrv": b"b",
+                "IMG_20230303_200000_00_002.insp": b"c",
+                "VID_20230304_100000_00_003.insv": b"d",
+            },
+        )
+
+        lookups: list[str] = []
+        real_find_date_folder = video_organise.find_date_folder
+
+        def counting_find_date_folder(dest: Path, date_str: str) -> Path | list[Path]:
+            lookups.append(date_str)
+            return real_find_date_folder(dest, date_str)
+
+        monkeypatch.setattr(video_organise, "find_date_folder", counting_find_date_folder)
+
+        exit_code, output = run_organise(capsys, src_dir, dest_dir)
+
+        assert exit_code == 0
+        assert sorted(lookups) == ["2023-03-03", "2023-03-04"]
+        assert output.count("2023-03-03 Moggs Sting/insta360/") == 3
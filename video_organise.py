@@ -8,9 +8,16 @@ directory into destination folders organized by date extracted from filename:
 All other file types are ignored.
 """
 
+import errno
+import os
 import re
 import shutil
+import sys
+import unicodedata
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
 from datetime import date
+from enum import StrEnum
 from pathlib import Path
 
 import typer
@@ -24,9 +31,19 @@ INSTA360_EXTENSIONS = {".insv", ".insp", ".lrv"}
 INSTA360_FILENAMES = {"fileinfo_list.list"}
 
 
+# Lowercased extensions without the dot, for matching against bare filenames
+_INSTA360_SUFFIXES = frozenset(ext[1:] for ext in INSTA360_EXTENSIONS)
+
+
+def is_insta360_name(name: str) -> bool:
+    """Check if a bare filename is an Insta360 file based on extension or filename."""
+    stem, _, suffix = name.rpartition(".")
+    return (bool(stem) and suffix.lower() in _INSTA360_SUFFIXES) or name in INSTA360_FILENAMES
+
+
 def is_insta360_file(file_path: Path) -> bool:
     """Check if file is an Insta360 file based on extension or filename."""
-    return file_path.suffix.lower() in INSTA360_EXTENSIONS or file_path.name in INSTA360_FILENAMES
+    return is_insta360_name(file_path.name)
 
 
 def is_in_excluded_folder(file_path: Path) -> bool:
@@ -34,6 +51,35 @@ def is_in_excluded_folder(file_path: Path) -> bool:
     return "MISC" in file_path.parts
 
 
+def scandir_walk(root: Path | str) -> Iterator[os.DirEntry[str]]:
+    """Recursively yield a DirEntry for every file under root.
+
+    Yields the same files as filtering root.rglob("*") with is_file(), but
+    file/directory type comes from the directory listing, so regular files and
+    directories cost no extra stat. Symlinks to directories are not descended
+    into and symlinks to files are included. Directories that can't be opened
+    are skipped, as are entries whose type can't be determined (e.g. symlink
+    loops), without affecting the rest of their directory.
+    """
+    stack = [os.fspath(root)]
+    while stack:
+        try:
+            it = os.scandir(stack.pop())
+        except OSError:
+            continue
+        with it:
+            for entry in it:
+                try:
+                    if entry.is_dir(follow_symlinks=False):
+                        stack.append(entry.path)
+                        continue
+                    is_file = entry.is_file()
+                except OSError:
+                    continue
+                if is_file:
+                    yield entry
+
+
 # Pattern to extract date from Insta360 filenames like:
 # VID_20241011_185020_00_003.insv
 # LRV_20240926_150746_01_003.lrv
@@ -48,34 +94,43 @@ def get_date_from_filename(file_path: Path) -> date | None:
     """
     match = FILENAME_DATE_PATTERN.match(file_path.name)
     if match:
-        year, month, day = int(match.group(1)), int(match.group(2)), int(match.group(3))
         try:
-            return date(year, month, day)
+            return date(int(match[1]), int(match[2]), int(match[3]))
         except ValueError:
             return None
     return None
 
 
-def get_file_date_from_filesystem(file_path: Path) -> date:
-    """Get creation date from filesystem.
+def get_file_date_from_stat(stat: os.stat_result) -> date:
+    """Get creation date from an already-fetched stat result.
 
     Uses st_birthtime on macOS, falls back to st_mtime.
     """
-    stat = file_path.stat()
     # st_birthtime is available on macOS
     timestamp = getattr(stat, "st_birthtime", None) or stat.st_mtime
     return date.fromtimestamp(timestamp)
 
 
-def get_file_date(file_path: Path) -> date:
+def get_file_date_from_filesystem(file_path: Path) -> date:
+    """Get creation date from filesystem.
+
+    Uses st_birthtime on macOS, falls back to st_mtime.
+    """
+    return get_file_date_from_stat(os.stat(file_path))
+
+
+def get_file_date(file_path: Path, stat: os.stat_result | None = None) -> date:
     """Get date for file, preferring filename over filesystem.
 
     First tries to extract date from filename pattern (e.g., VID_20241011_...).
-    Falls back to filesystem creation date if no date in filename.
+    Falls back to filesystem creation date if no date in filename, using
+    stat if the caller already has it.
     """
     filename_date = get_date_from_filename(file_path)
     if filename_date:
         return filename_date
+    if stat is not None:
+        return get_file_date_from_stat(stat)
     return get_file_date_from_filesystem(file_path)
 
 
@@ -85,21 +140,136 @@ def should_copy(src: Path, dest: Path) -> bool:
     Returns False if source and destination are the same file.
     Returns True if destination doesn't exist or has different size.
     """
-    # Skip if source and destination are the same file
-    if src.resolve() == dest.resolve():
-        return False
-    if not dest.exists():
+    try:
+        dest_stat = dest.stat()
+    except FileNotFoundError:
         return True
-    return src.stat().st_size != dest.stat().st_size
+    src_stat = src.stat()
+    # Skip if source and destination are the same file (compares st_dev/st_ino,
+    # so symlinks are detected without resolving the whole path)
+    if os.path.samestat(src_stat, dest_stat):
+        return False
+    return src_stat.st_size != dest_stat.st_size
+
+
+def files_match(a: Path | str, b: Path | str) -> bool:
+    """Compare two files byte for byte, stopping at the first difference."""
+    with open(a, "rb") as fa, open(b, "rb") as fb:
+        while True:
+            chunk = fa.read(1 << 20)
+            if chunk != fb.read(1 << 20):
+                return False
+            if not chunk:
+                return True
+
+
+class Verify(StrEnum):
+    """How an existing destination file is checked before it is skipped."""
+
+    NONE = "none"  # a file with the exact name is enough; sizes aren't compared
+    SIZE = "size"
+    CONTENT = "content"  # same size and identical bytes
+
+
+# copy_file_range errors meaning it can't be used for these two files (old
+# kernel, cross-device before Linux 5.3, unsupported filesystem), as opposed
+# to a real I/O error
+_COPY_FILE_RANGE_UNSUPPORTED = {errno.ENOSYS, errno.EXDEV, errno.EINVAL, errno.EOPNOTSUPP, errno.ETXTBSY}
+
+
+def _copy_file_range(src: Path, dest: Path) -> bool:
+    """Copy file data with os.copy_file_range.
+
+    Returns False if the platform or filesystem doesn't support it for these
+    files, or if it stopped short of the source size (some FUSE and network
+    filesystems report end-of-file straight away); dest must then be rewritten.
+    """
+    if not hasattr(os, "copy_file_range"):
+        return False
+    with open(src, "rb") as fsrc, open(dest, "wb") as fdst:
+        in_fd, out_fd = fsrc.fileno(), fdst.fileno()
+        # Ask for aggressive readahead on the source (card readers often get
+        # a small default window), and drop its pages afterwards: each clip
+        # is read once, so caching it would only push out more useful data
+        _fadvise(in_fd, os.POSIX_FADV_SEQUENTIAL)
+        try:
+            size = os.fstat(in_fd).st_size
+            count = max(size, 1 << 23)
+            copied = 0
+            while True:
+                try:
+                    n = os.copy_file_range(in_fd, out_fd, count)
+                except OSError as e:
+                    if copied == 0 and e.errno in _COPY_FILE_RANGE_UNSUPPORTED:
+                        return False
+                    raise
+                if n == 0:
+                    return copied == size
+                copied += n
+        finally:
+            _fadvise(in_fd, os.POSIX_FADV_DONTNEED)
+
+
+def _fadvise(fd: int, advice: int) -> None:
+    """Give the kernel an access-pattern hint for the whole file; it's only a hint."""
+    try:
+        os.posix_fadvise(fd, 0, 0, advice)
+    except OSError:
+        pass
+
+
+def copy_file(src: Path, dest: Path) -> None:
+    """Copy src to dest with its timestamps and permissions, like shutil.copy2.
+
+    Tries os.copy_file_range first (Linux), which lets the filesystem clone the
+    data (reflinks on btrfs/XFS) or copy it server-side (NFS 4.2, SMB), then
+    falls back to shutil.copyfile (sendfile/fcopyfile).
+
+    The data is written to a hidden ".{name}.part" file that is renamed into
+    place once complete, so an interrupted copy never leaves a truncated file
+    under the real name for a later run to mistake for an imported one.
+    """
+    tmp = dest.with_name(f".{dest.name}.part")
+    try:
+        if not _copy_file_range(src, tmp):
+            shutil.copyfile(src, tmp)
+        shutil.copystat(src, tmp)
+        os.replace(tmp, dest)
+    except BaseException:
+        try:
+            os.unlink(tmp)
+        except FileNotFoundError:
+            pass
+        raise
+
+
+def move_file(src: Path, dest: Path) -> None:
+    """Move src to dest, replacing any existing file.
+
+    A plain rename when both are on the same filesystem; otherwise (e.g. card
+    to archive) copies with copy_file and then removes src, but only once
+    dest is the same size. Raises OSError, leaving src in place, if not.
+    """
+    try:
+        os.replace(src, dest)
+    except OSError as e:
+        if e.errno != errno.EXDEV:
+            raise
+        copy_file(src, dest)
+        src_size, dest_size = os.stat(src).st_size, os.stat(dest).st_size
+        if dest_size != src_size:
+            raise OSError(errno.EIO, f"Incomplete copy ({dest_size} of {src_size} bytes), source kept", str(dest))
+        os.unlink(src)
+
+
+_SIZE_UNITS = ("B", "KB", "MB", "GB", "TB", "PB")
 
 
 def format_size(size_bytes: int) -> str:
     """Format bytes as human-readable string."""
-    for unit in ["B", "KB", "MB", "GB", "TB"]:
-        if size_bytes < 1024:
-            return f"{size_bytes:.1f} {unit}"
-        size_bytes /= 1024
-    return f"{size_bytes:.1f} PB"
+    # Each unit is 2**10 of the previous, so the bit length picks it directly
+    i = min(max(size_bytes.bit_length() - 1, 0) // 10, len(_SIZE_UNITS) - 1)
+    return f"{size_bytes / (1 << (10 * i)):.1f} {_SIZE_UNITS[i]}"
 
 
 def find_date_folder(dest_dir: Path, date_str: str) -> Path | list[Path]:
@@ -125,108 +295,156 @@ def find_date_folder(dest_dir: Path, date_str: str) -> Path | list[Path]:
         return matches
 
 
-@app.command()
-def main(
-    source_directory: Path = typer.Argument(
-        ...,
-        exists=True,
-        file_okay=False,
-        dir_okay=True,
-        readable=True,
-        resolve_path=True,
-        help="Source directory containing Insta360 files to organize.",
-    ),
-    destination_directory: Path = typer.Argument(
-        ...,
-        exists=True,
-        file_okay=False,
-        dir_okay=True,
-        writable=True,
-        resolve_path=True,
-        help="Destination directory for organized files.",
-    ),
-    approve: bool = typer.Option(
-        False,
-        "--approve",
-        help="Actually copy/move files. Without this flag, only shows what would be done.",
-    ),
-    move: bool = typer.Option(
-        False,
-        "--move",
-        help="Move files instead of copying them.",
-    ),
-) -> None:
-    """Organize Insta360 files from source into date-based folders in destination.
+def _name_key(name: str) -> str:
+    """Normalise a filename so it matches on case-insensitive filesystems (e.g. APFS)."""
+    if not name.isascii():
+        name = unicodedata.normalize("NFC", name)
+    return name.casefold()
 
-    Only Insta360 files (.insv, .insp, .lrv, fileinfo_list.list) are processed.
-    All other files are ignored.
 
-    Files are copied to: {destination}/YYYY-MM-DD/insta360/{original-filename}
+def list_names(directory: Path) -> frozenset[str] | None:
+    """Return the normalised names of all entries in directory, or none if it isn't a directory.
 
-    By default, runs in dry-run mode showing what would be copied.
-    Use --approve to actually copy files.
+    A name missing from the result is certainly missing from the directory. A
+    name present may still differ in case on a case-sensitive filesystem.
+    Returns None if the directory exists but can't be listed (e.g. no read
+    permission): its contents are unknown, so every name must be checked.
     """
-    # Collect all Insta360 files recursively (excluding MISC folder)
-    files = [
-        f for f in source_directory.rglob("*")
-        if f.is_file() and is_insta360_file(f) and not is_in_excluded_folder(f)
-    ]
-
-    if not files:
-        typer.echo("No Insta360 files found in source directory.")
-        raise typer.Exit()
+    try:
+        return frozenset(_name_key(name) for name in os.listdir(directory))
+    except (FileNotFoundError, NotADirectoryError):
+        return frozenset()
+    except OSError:
+        return None
+
+
+def organise(
+    source_directory: Path,
+    destination_directory: Path,
+    approve: bool = False,
+    move: bool = False,
+    jobs: int = 4,
+    verify: Verify = Verify.SIZE,
+) -> None:
+    """Organize Insta360 files from source into date-based folders in destination.
 
-    # Check for duplicate filenames
+    This is the implementation behind the CLI command; it can be called
+    directly with already-validated directories. Raises typer.Exit to stop
+    early, with a non-zero exit code on errors.
+    """
+    # Scan and plan in a single pass over the source tree. Nothing is copied
+    # until the whole tree has been seen: duplicate filenames and ambiguous
+    # date folders must stop the run before any file is touched.
     filenames: dict[str, list[Path]] = {}
-    for f in files:
-        filenames.setdefault(f.name, []).append(f)
 
-    duplicates = {name: paths for name, paths in filenames.items() if len(paths) > 1}
-    if duplicates:
-        typer.echo("Error: Duplicate filenames found:", err=True)
-        for name, paths in sorted(duplicates.items()):
-            typer.echo(f"  {name}:", err=True)
-            for p in paths:
-                typer.echo(f"    - {p}", err=True)
-        raise typer.Exit(1)
-
-    # reason is: "new" (dest missing) or "size_mismatch" (with src_size, dest_size)
+    # reason is: "new" (dest missing), "size_mismatch" (with src_size, dest_size)
+    # or "content_mismatch" (same size, different bytes; only with Verify.CONTENT)
     to_copy: list[tuple[Path, Path, str]] = []
-    skipped_same_file: list[Path] = []
-    skipped_exists: list[Path] = []
+    skipped_same_file = 0
+    skipped_exists = 0
+    skipped_unverified = 0
     total_size = 0
 
     # Track dates with multiple matching folders (error case)
     ambiguous_dates: dict[str, list[Path]] = {}
 
-    for src_file in files:
-        file_date = get_file_date(src_file)
-        date_str = file_date.strftime("%Y-%m-%d")
-        date_folder_result = find_date_folder(destination_directory, date_str)
+    # "{date folder}/insta360" (as a str) per date with the names already in
+    # it, or None if the date is ambiguous. find_date_folder() lists the whole
+    # destination, so it runs once per date rather than once per file, and
+    # the listing lets new files skip their destination stat (the names are
+    # None if the folder couldn't be listed, so every file is statted).
+    insta360_dirs: dict[date, tuple[str, frozenset[str] | None] | None] = {}
+
+    for entry in scandir_walk(source_directory):
+        # Only Insta360 files, excluding the MISC folder. The name check runs
+        # on the DirEntry first, so other files never become Paths.
+        if not is_insta360_name(entry.name):
+            continue
+        src_file = Path(entry.path)
+        if is_in_excluded_folder(src_file):
+            continue
+
+        same_name = filenames.setdefault(entry.name, [])
+        same_name.append(src_file)
+        if len(same_name) > 1:
+            # Duplicate filename, reported below; no need to plan it
+            continue
 
-        # Check for ambiguous date folders
-        if isinstance(date_folder_result, list):
-            if date_str not in ambiguous_dates:
+        # One stat per source file serves the date fallback, the same-file
+        # check and the size comparison. The DirEntry caches it, and on
+        # Windows it comes from the directory listing without a syscall (with
+        # st_ino 0 there, so a same-file source is counted as "exists").
+        src_stat = entry.stat()
+        file_date = get_file_date(src_file, src_stat)
+        try:
+            dest_info = insta360_dirs[file_date]
+        except KeyError:
+            date_str = file_date.isoformat()
+            date_folder_result = find_date_folder(destination_directory, date_str)
+            # Check for ambiguous date folders
+            if isinstance(date_folder_result, list):
                 ambiguous_dates[date_str] = date_folder_result
+                dest_info = None
+            else:
+                insta360_dir = date_folder_result / "insta360"
+                dest_info = (os.fspath(insta360_dir), list_names(insta360_dir))
+            insta360_dirs[file_date] = dest_info
+
+        if dest_info is None:
             continue
 
-        date_folder = date_folder_result
-        dest_path = date_folder / "insta360" / src_file.name
-
-        # Check if source and destination are the same file
-        if src_file.resolve() == dest_path.resolve():
-            skipped_same_file.append(src_file)
-        elif not dest_path.exists():
-            to_copy.append((src_file, dest_path, "new"))
-            total_size += src_file.stat().st_size
-        elif src_file.stat().st_size != dest_path.stat().st_size:
-            src_size = src_file.stat().st_size
-            dest_size = dest_path.stat().st_size
-            reason = f"size_mismatch:{src_size}:{dest_size}"
-            to_copy.append((src_file, dest_path, reason))
-            total_size += src_size
+        # The destination stays a str until it is known to need copying, so
+        # already-imported files (the usual case on re-runs) never build a Path
+        insta360_dir, existing_names = dest_info
+        dest = os.path.join(insta360_dir, entry.name)
+
+        if existing_names is not None and _name_key(entry.name) not in existing_names:
+            dest_stat = None
+        elif verify == Verify.NONE:
+            # The listing match ignores case, so confirm the exact name with
+            # an lstat (no size comparison) before trusting it
+            try:
+                os.lstat(dest)
+            except FileNotFoundError:
+                dest_stat = None
+            else:
+                skipped_unverified += 1
+                continue
+        else:
+            try:
+                dest_stat = os.stat(dest)
+            except FileNotFoundError:
+                dest_stat = None
+
+        if dest_stat is None:
+            to_copy.append((src_file, Path(dest), "new"))
+            total_size += src_stat.st_size
+        elif os.path.samestat(src_stat, dest_stat):
+            # Source and destination are the same file
+            skipped_same_file += 1
+        elif src_stat.st_size != dest_stat.st_size:
+            reason = f"size_mismatch:{src_stat.st_size}:{dest_stat.st_size}"
+            to_copy.append((src_file, Path(dest), reason))
+            total_size += src_stat.st_size
+        elif verify == Verify.CONTENT and not files_match(entry.path, dest):
+            to_copy.append((src_file, Path(dest), "content_mismatch"))
+            total_size += src_stat.st_size
         else:
-            skipped_exists.append(src_file)
+            skipped_exists += 1
+
+    if not filenames:
+        typer.echo("No Insta360 files found in source directory.")
+        raise typer.Exit()
+
+    # Error if any filename appears more than once
+    duplicates = {name: paths for name, paths in filenames.items() if len(paths) > 1}
+    if duplicates:
+        typer.echo("Error: Duplicate filenames found:", err=True)
+        for name, paths in sorted(duplicates.items()):
+            typer.echo(f"  {name}:", err=True)
+            for p in paths:
+                typer.echo(f"    - {p}", err=True)
+        raise typer.Exit(1)
 
     # Error if any dates have multiple matching destination folders
     if ambiguous_dates:
@@ -245,36 +463,130 @@ def main(
         typer.echo(f"[DRY RUN] Would {'move' if move else 'copy'} {len(to_copy)} files ({format_size(total_size)})")
 
     if skipped_same_file:
-        typer.echo(f"Skipping {len(skipped_same_file)} files (already in correct location)")
+        typer.echo(f"Skipping {skipped_same_file} files (already in correct location)")
     if skipped_exists:
-        typer.echo(f"Skipping {len(skipped_exists)} files (already exist with same size)")
+        typer.echo(f"Skipping {skipped_exists} files (already exist with same size)")
+    if skipped_unverified:
+        typer.echo(f"Skipping {skipped_unverified} files (already exist, not verified)")
+
+    if not to_copy:
+        # Usual for a re-run: no folders to create, no pool to start
+        raise typer.Exit()
 
     typer.echo("")
 
+    # Per-file lines go straight to sys.stdout: typer.echo() resolves the
+    # stream and flushes on every call, which dominates a long listing
+    write = sys.stdout.write
+
     # Process files
-    for src_file, dest_path, reason in to_copy:
-        if approve:
-            dest_path.parent.mkdir(parents=True, exist_ok=True)
+    if approve:
+        # Many files share a date folder, so create each one once up front
+        # rather than once per file (this also keeps mkdir out of the workers)
+        for dest_dir in {dest_path.parent for _, dest_path, _ in to_copy}:
+            dest_dir.mkdir(parents=True, exist_ok=True)
+
+        def transfer(item: tuple[Path, Path, str]) -> None:
+            src_file, dest_path, _ = item
             if move:
-                shutil.move(src_file, dest_path)
-                typer.echo(f"Moved: {src_file} -> {dest_path}")
+                move_file(src_file, dest_path)
             else:
-                shutil.copy2(src_file, dest_path)
-                typer.echo(f"Copied: {src_file} -> {dest_path}")
-        else:
+                copy_file(src_file, dest_path)
+
+        # Transfers are I/O-bound, so several run at once to overlap source
+        # reads with destination writes (e.g. SD card to NAS). map() returns
+        # results in order, so the log lists files in planning order.
+        verb = "Moved" if move else "Copied"
+        # Not a with-block: its exit would wait for the transfers still running
+        executor = ThreadPoolExecutor(max_workers=max(1, min(jobs, len(to_copy))))
+        try:
+            for (src_file, dest_path, _), _ in zip(to_copy, executor.map(transfer, to_copy)):
+                write(f"{verb}: {src_file} -> {dest_path}\n")
+                # Flush as each transfer finishes so piped output shows progress
+                sys.stdout.flush()
+        except BaseException:
+            # Stop at the first failure (or Ctrl-C): drop the queue and report
+            # straight away instead of waiting for in-flight copies
+            executor.shutdown(wait=False, cancel_futures=True)
+            raise
+        executor.shutdown()
+    else:
+        for src_file, dest_path, reason in to_copy:
             # Explain why the file would be copied
             if reason == "new":
                 reason_text = "(dest missing)"
+            elif reason == "content_mismatch":
+                reason_text = "(content differs)"
             else:
                 # reason is "size_mismatch:src_size:dest_size"
                 _, src_size, dest_size = reason.split(":")
                 reason_text = f"(size mismatch: src {format_size(int(src_size))} vs dest {format_size(int(dest_size))})"
-            typer.echo(f"Would {'move' if move else 'copy'}: {src_file} -> {dest_path} {reason_text}")
+            write(f"Would {'move' if move else 'copy'}: {src_file} -> {dest_path} {reason_text}\n")
+        sys.stdout.flush()
 
-    if not approve and to_copy:
+    if not approve:
         typer.echo("")
         typer.echo(f"Run with --approve to {'move' if move else 'copy'} files.")
 
 
+@app.command()
+def main(
+    source_directory: Path = typer.Argument(
+        ...,
+        exists=True,
+        file_okay=False,
+        dir_okay=True,
+        readable=True,
+        resolve_path=True,
+        help="Source directory containing Insta360 files to organize.",
+    ),
+    destination_directory: Path = typer.Argument(
+        ...,
+        exists=True,
+        file_okay=False,
+        dir_okay=True,
+        writable=True,
+        resolve_path=True,
+        help="Destination directory for organized files.",
+    ),
+    approve: bool = typer.Option(
+        False,
+        "--approve",
+        help="Actually copy/move files. Without this flag, only shows what would be done.",
+    ),
+    move: bool = typer.Option(
+        False,
+        "--move",
+        help="Move files instead of copying them.",
+    ),
+    jobs: int = typer.Option(
+        4,
+        "--jobs",
+        "-j",
+        min=1,
+        help="Number of files to copy/move in parallel.",
+    ),
+    verify: Verify = typer.Option(
+        Verify.SIZE,
+        "--verify",
+        help=(
+            "How to check files already at the destination: none (exact name only, sizes not compared), "
+            "size, or content (byte comparison)."
+        ),
+    ),
+) -> None:
+    """Organize Insta360 files from source into date-based folders in destination.
+
+    Only Insta360 files (.insv, .insp, .lrv, fileinfo_list.list) are processed.
+    All other files are ignored.
+
+    Files are copied to: {destination}/YYYY-MM-DD/insta360/{original-filename}
+
+    By default, runs in dry-run mode showing what would be copied.
+    Use --approve to actually copy files.
+    """
+    organise(source_directory, destination_directory, approve=approve, move=move, jobs=jobs, verify=verify)
+
+
 if __name__ == "__main__":
     app()